@@ -0,0 +1,108 @@
+# ========================================================================
+# $File: aabb.py $
+# $Date: 2026-10-18 09:12:40 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+
+class AABB(object):
+    """
+    @class AABB
+    @brief Axis aligned bounding box in world space.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, min_x = 0, min_y = 0, max_x = 0, max_y = 0):
+        """Constructor."""
+
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+
+    #====================
+    # Public Methods
+    def overlaps(self, other):
+        """
+        Check if two boxes overlap each other.
+        @param { AABB } other : box to test against.
+        @return { bool } : True if overlapping.
+        """
+        return (self.min_x <= other.max_x and
+                self.max_x >= other.min_x and
+                self.min_y <= other.max_y and
+                self.max_y >= other.min_y)
+
+    def contains(self, other):
+        """
+        Check if the other box is fully inside this box.
+        @param { AABB } other : box to test.
+        @return { bool } : True if 'other' is inside.
+        """
+        return (self.min_x <= other.min_x and
+                self.min_y <= other.min_y and
+                self.max_x >= other.max_x and
+                self.max_y >= other.max_y)
+
+    def contains_point(self, x, y):
+        """
+        Check if the point is inside this box.
+        @param { float } x : point on x-axis.
+        @param { float } y : point on y-axis.
+        @return { bool } : True if inside.
+        """
+        return (self.min_x <= x <= self.max_x and
+                self.min_y <= y <= self.max_y)
+
+    def perimeter(self):
+        """
+        Perimeter of the box, use as the cost of a box.
+        @return { float } : perimeter.
+        """
+        return 2.0 * ((self.max_x - self.min_x) + (self.max_y - self.min_y))
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
+    def set_bounds(self, min_x, min_y, max_x, max_y):
+        """Set all four bounds at once."""
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+
+    def set_aabb(self, other):
+        """Copy bounds from another box."""
+        self.min_x = other.min_x
+        self.min_y = other.min_y
+        self.max_x = other.max_x
+        self.max_y = other.max_y
+
+    def set_combine(self, boxA, boxB):
+        """Set this box to the union of two boxes."""
+        self.min_x = min(boxA.min_x, boxB.min_x)
+        self.min_y = min(boxA.min_y, boxB.min_y)
+        self.max_x = max(boxA.max_x, boxB.max_x)
+        self.max_y = max(boxA.max_y, boxB.max_y)
@@ -0,0 +1,341 @@
+# ========================================================================
+# $File: batch_collision.py $
+# $Date: 2026-10-18 17:26:40 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.physics import Physics
+from jcspygm_physics.collision import Collision
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BatchCollision(object):
+    """
+    @class BatchCollision
+    @brief Narrowphase for many pairs of the same shape types at
+    once with NumPy, pairs are given as index arrays into arrays of
+    shape data. NumPy is optional, check 'HAS_NUMPY' and use the
+    per pair colliders in 'Collision' when it is missing.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    HAS_NUMPY = numpy is not None
+
+    # below this many pairs the per pair colliders are faster.
+    MIN_BATCH_SIZE = 32
+
+    # Most entries of the (pairs, faces, vertices) support array
+    # built at once, pairs are split in chunks to stay under it.
+    # Every polygon is padded to the biggest vertex count so one
+    # big polygon would otherwise blow it up for the whole batch.
+    MAX_SUPPORT_ENTRIES = 1 << 18
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+
+    #====================
+    # Public Methods
+    @staticmethod
+    def bounding_circles_overlap(positions, radii, indexA, indexB):
+        """
+        Same test as 'Collision.bounding_circles_overlap' on each
+        pair, and count the rejected pairs the same way.
+        @param { numpy.ndarray } positions : (n, 2) body positions.
+        @param { numpy.ndarray } radii : (n,) bounding radius.
+        @param { numpy.ndarray } indexA : (m,) first shape of each pair.
+        @param { numpy.ndarray } indexB : (m,) second shape of each pair.
+        @return { numpy.ndarray } : index of the pairs that can touch.
+        """
+
+        delta = positions[indexB] - positions[indexA]
+        dist_sqr = numpy.einsum('ij,ij->i', delta, delta)
+        radius = radii[indexA] + radii[indexB]
+
+        overlap = numpy.nonzero(dist_sqr <= radius * radius)[0]
+        Collision.bounding_reject_count += len(indexA) - len(overlap)
+        return overlap
+
+    @staticmethod
+    def circle_to_circle(positions, radii, indexA, indexB):
+        """
+        Collide circle pairs, same result as
+        'Collision.circle_to_circle' on each pair.
+        @param { numpy.ndarray } positions : (n, 2) circle centers.
+        @param { numpy.ndarray } radii : (n,) circle radius.
+        @param { numpy.ndarray } indexA : (m,) first circle of each pair.
+        @param { numpy.ndarray } indexB : (m,) second circle of each pair.
+        @return { tuple } : (hits, normals, penetrations, contacts).
+        'hits' is the index of the pairs in contact, the other
+        arrays only hold those pairs, normals and contacts are (k, 2).
+        """
+
+        posA = positions[indexA]
+        rA = radii[indexA]
+
+        # Calculate translational vector, which is normal
+        delta = positions[indexB] - posA
+        dist_sqr = numpy.einsum('ij,ij->i', delta, delta)
+        radius = rA + radii[indexB]
+
+        # Only keep the pairs in contact
+        hits = numpy.nonzero(dist_sqr < radius * radius)[0]
+
+        delta = delta[hits]
+        posA = posA[hits]
+        rA = rA[hits]
+
+        distance = numpy.sqrt(dist_sqr[hits])
+        penetrations = radius[hits] - distance
+
+        same = distance == 0.0
+        normals = delta / numpy.where(same, 1.0, distance)[:, None]
+        contacts = normals * rA[:, None] + posA
+
+        # Circles at the same position push along x by radius A.
+        normals[same] = (1.0, 0.0)
+        penetrations[same] = rA[same]
+        contacts[same] = posA[same]
+
+        return hits, normals, penetrations, contacts
+
+    @staticmethod
+    def pack_polygons(polygons):
+        """
+        Pack the world vertices and normals of polygons in padded
+        arrays, all polygons padded to the biggest vertex count.
+        Padding repeat the first vertex so it never change a
+        support point.
+        @param { Polygon[] } polygons : polygons to pack.
+        @return { tuple } : (vertices, normals, counts), vertices
+        and normals are (n, m, 2), counts is (n,).
+        """
+
+        max_count = max(polygon.vertex_count for polygon in polygons)
+
+        vertices = []
+        normals = []
+        counts = []
+        for polygon in polygons:
+            count = polygon.vertex_count
+            world_vertices = polygon.get_world_vertices()
+            world_normals = polygon.get_world_normals()
+
+            poly_vertices = [(world_vertices[index].x, world_vertices[index].y)
+                             for index in range(0, count)]
+            poly_normals = [(world_normals[index].x, world_normals[index].y)
+                            for index in range(0, count)]
+
+            padding = max_count - count
+            poly_vertices.extend([poly_vertices[0]] * padding)
+            poly_normals.extend([poly_normals[0]] * padding)
+
+            vertices.append(poly_vertices)
+            normals.append(poly_normals)
+            counts.append(count)
+
+        return (numpy.array(vertices, dtype = float),
+                numpy.array(normals, dtype = float),
+                numpy.array(counts))
+
+    @staticmethod
+    def polygon_to_polygon(vertices, normals, counts, indexA, indexB):
+        """
+        Collide polygon pairs, same result as
+        'Collision.polygon_to_polygon' on each pair.
+        @param { numpy.ndarray } vertices : (n, m, 2) world vertices
+        from 'pack_polygons'.
+        @param { numpy.ndarray } normals : (n, m, 2) world normals.
+        @param { numpy.ndarray } counts : (n,) vertex count.
+        @param { numpy.ndarray } indexA : (k,) first polygon of each pair.
+        @param { numpy.ndarray } indexB : (k,) second polygon of each pair.
+        @return { tuple } : (hits, normals, penetrations, contacts,
+        contact_counts, feature_ids). 'hits' is the index of the pairs
+        in contact, the other arrays only hold those pairs. Contacts
+        are (h, 2, 2), feature ids (h, 2).
+        """
+
+        pair_count = len(indexA)
+        pairs = numpy.arange(pair_count)
+
+        # Check for a separating axis with A's and B's face planes
+        penetrationA, faceA = BatchCollision.axis_least_penetration(
+            vertices, normals, counts, indexA, indexB)
+        penetrationB, faceB = BatchCollision.axis_least_penetration(
+            vertices, normals, counts, indexB, indexA)
+
+        touching = (penetrationA < 0.0) & (penetrationB < 0.0)
+
+        # Determine which shape contains reference face, same bias
+        # as 'jcs_math.bias_greater_than'.
+        flip = ~(penetrationA >= penetrationB * 0.95 + penetrationA * 0.01)
+        ref_poly = numpy.where(flip, indexB, indexA)
+        inc_poly = numpy.where(flip, indexA, indexB)
+        reference_index = numpy.where(flip, faceB, faceA)
+
+        ref_count = counts[ref_poly]
+        inc_count = counts[inc_poly]
+
+        # Find most anti-normal face on incident polygon
+        reference_normal = normals[ref_poly, reference_index]
+        dots = numpy.einsum('kmd,kd->km', normals[inc_poly], reference_normal)
+        dots[numpy.arange(dots.shape[1]) >= inc_count[:, None]] = numpy.inf
+        incident_index = numpy.argmin(dots, axis = 1)
+        incident_next = (incident_index + 1) % inc_count
+
+        face0 = vertices[inc_poly, incident_index]
+        face1 = vertices[inc_poly, incident_next]
+        ids0 = incident_index
+        ids1 = incident_next
+
+        # Setup reference face vertices
+        v1 = vertices[ref_poly, reference_index]
+        v2 = vertices[ref_poly, (reference_index + 1) % ref_count]
+
+        # Calculate reference face side normal in world space, a
+        # zero length edge is left as is like 'Vector2.normalize'.
+        side_plane_normal = v2 - v1
+        side_length = numpy.sqrt(
+            numpy.einsum('kd,kd->k', side_plane_normal, side_plane_normal))
+        side_plane_normal /= numpy.where(
+            side_length > Physics.EPSILON, side_length, 1.0)[:, None]
+
+        # Orthogonalize
+        ref_face_normal = numpy.empty_like(side_plane_normal)
+        ref_face_normal[:, 0] = side_plane_normal[:, 1]
+        ref_face_normal[:, 1] = -side_plane_normal[:, 0]
+
+        refC = numpy.einsum('kd,kd->k', ref_face_normal, v1)
+        neg_side = -numpy.einsum('kd,kd->k', side_plane_normal, v1)
+        pos_side = numpy.einsum('kd,kd->k', side_plane_normal, v2)
+
+        # Clip incident face to reference face side planes
+        face0, face1, ids0, ids1, valid = BatchCollision.clip(
+            -side_plane_normal, neg_side, face0, face1, ids0, ids1,
+            Collision.FEATURE_CLIP_NEGATIVE)
+        touching &= valid
+        face0, face1, ids0, ids1, valid = BatchCollision.clip(
+            side_plane_normal, pos_side, face0, face1, ids0, ids1,
+            Collision.FEATURE_CLIP_POSITIVE)
+        touching &= valid
+
+        # Keep points behind reference face
+        separation0 = numpy.einsum('kd,kd->k', ref_face_normal, face0) - refC
+        separation1 = numpy.einsum('kd,kd->k', ref_face_normal, face1) - refC
+        keep0 = separation0 <= 0.0
+        keep1 = separation1 <= 0.0
+
+        contact_counts = keep0.astype(int) + keep1
+        penetrations = ((numpy.where(keep0, -separation0, 0.0) +
+                         numpy.where(keep1, -separation1, 0.0)) /
+                        numpy.maximum(contact_counts, 1))
+
+        # Second point move to the front if the first is dropped
+        contacts = numpy.empty((pair_count, 2, 2))
+        contacts[:, 0] = numpy.where(keep0[:, None], face0, face1)
+        contacts[:, 1] = face1
+
+        flip_bit = flip.astype(int)
+        reference_face = reference_index << 8
+        feature_ids = numpy.empty((pair_count, 2), dtype = int)
+        feature_ids[:, 0] = reference_face | (numpy.where(keep0, ids0, ids1) << 1) | flip_bit
+        feature_ids[:, 1] = reference_face | (ids1 << 1) | flip_bit
+
+        # Flip
+        manifold_normals = numpy.where(flip[:, None], -ref_face_normal, ref_face_normal)
+
+        hits = pairs[touching & (contact_counts > 0)]
+
+        return (hits, manifold_normals[hits], penetrations[hits],
+                contacts[hits], contact_counts[hits], feature_ids[hits])
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    @staticmethod
+    def axis_least_penetration(vertices, normals, counts, indexA, indexB):
+        """
+        Face of A with the greatest separation from B for each pair.
+        @return { tuple } : (separation, face index), (k,) each.
+        """
+
+        pair_count = len(indexA)
+        vertex_count = vertices.shape[1]
+        chunk_size = max(1, BatchCollision.MAX_SUPPORT_ENTRIES //
+                         (vertex_count * vertex_count))
+
+        best_separation = numpy.empty(pair_count)
+        best_face = numpy.empty(pair_count, dtype = int)
+
+        for start in range(0, pair_count, chunk_size):
+            chunk = slice(start, start + chunk_size)
+            chunkA = indexA[chunk]
+            normalsA = normals[chunkA]
+
+            # Support point of B along -n, projected on n
+            support = numpy.einsum('kid,kjd->kij', normalsA,
+                                   vertices[indexB[chunk]]).min(axis = 2)
+
+            separation = support - numpy.einsum('kid,kid->ki', normalsA, vertices[chunkA])
+
+            # Padding faces never win
+            separation[numpy.arange(vertex_count) >= counts[chunkA][:, None]] = -numpy.inf
+
+            face = numpy.argmax(separation, axis = 1)
+            best_face[chunk] = face
+            best_separation[chunk] = separation[numpy.arange(len(face)), face]
+
+        return best_separation, best_face
+
+    @staticmethod
+    def clip(n, c, face0, face1, ids0, ids1, clip_id):
+        """
+        Clip the incident faces against planes, same as
+        'Collision.clip' on each pair.
+        @return { tuple } : (face0, face1, ids0, ids1, valid), valid
+        is False where less than two points are left.
+        """
+
+        # Retrieve distances from each endpoint to the line
+        d1 = numpy.einsum('kd,kd->k', n, face0) - c
+        d2 = numpy.einsum('kd,kd->k', n, face1) - c
+
+        in1 = d1 <= 0.0
+        in2 = d2 <= 0.0
+        crossing = d1 * d2 < 0.0
+
+        valid = (in1.astype(int) + in2 + crossing) >= 2
+
+        # Intersection point
+        alpha = d1 / numpy.where(crossing, d1 - d2, 1.0)
+        intersection = face0 + alpha[:, None] * (face1 - face0)
+
+        # Both in keep the face, else the point in and the intersection
+        new_face0 = numpy.where(in1[:, None], face0, face1)
+        new_ids0 = numpy.where(in1, ids0, ids1)
+        new_face1 = numpy.where((in1 & in2)[:, None], face1, intersection)
+        new_ids1 = numpy.where(in1 & in2, ids1, clip_id)
+
+        return new_face0, new_face1, new_ids0, new_ids1, valid
+
+    #====================
+    # setter / getter
@@ -0,0 +1,315 @@
+# ========================================================================
+# $File: body_store.py $
+# $Date: 2026-10-18 22:31:48 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.physics import Physics
+from jcspygm_physics.vector2 import Vector2
+from jcspygm_physics.rigidbody import Rigidbody
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BodyStore(object):
+    """
+    @class BodyStore
+    @brief Keep the state of every body in NumPy arrays, one row
+    per body, so all bodies are integrated with one array
+    expression per quantity. Bodies added to the store become a
+    'BodyHandle' reading and writing their row, they stay the same
+    object so references to them keep working.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    HAS_NUMPY = numpy is not None
+
+    INITIAL_CAPACITY = 64
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, capacity = INITIAL_CAPACITY):
+        """
+        Constructor.
+        @param { int } capacity : rows allocated up front, the
+        arrays double when full.
+        """
+
+        # { BodyHandle[] } : handle of each row.
+        self.bodies = []
+
+        self.positions = numpy.zeros((capacity, 2))
+        self.velocities = numpy.zeros((capacity, 2))
+        self.forces = numpy.zeros((capacity, 2))
+        self.orientations = numpy.zeros(capacity)
+        self.angular_velocities = numpy.zeros(capacity)
+        self.torques = numpy.zeros(capacity)
+        self.inverse_masses = numpy.zeros(capacity)
+        self.inverse_inertias = numpy.zeros(capacity)
+
+    #====================
+    # Public Methods
+    def add_body(self, body):
+        """
+        Copy the body into a new row and turn it into a 'BodyHandle'
+        onto that row.
+        @param { Rigidbody } body : body to store.
+        @return { BodyHandle } : 'body' itself.
+        """
+
+        index = len(self.bodies)
+        if index == len(self.inverse_masses):
+            self.grow()
+
+        self.positions[index] = (body.position.x, body.position.y)
+        self.velocities[index] = (body.velocity.x, body.velocity.y)
+        self.forces[index] = (body.force.x, body.force.y)
+        self.orientations[index] = body.orientation
+        self.angular_velocities[index] = body.angular_velocity
+        self.torques[index] = body.torque
+        self.inverse_masses[index] = body.inverse_mass
+        self.inverse_inertias[index] = body.inverse_inertia
+
+        # same slots, so the body can change class in place.
+        body.__class__ = BodyHandle
+        body.attach(self, index)
+
+        self.bodies.append(body)
+        return body
+
+    def integrate_forces(self, indices, deltaTime):
+        """
+        Same as 'Physics.integrate_forces' on each body.
+        @param { numpy.ndarray } indices : rows of the awake
+        dynamic bodies.
+        @param { float } deltaTime : time step.
+        """
+
+        halfDeltaTime = deltaTime * 0.5
+        gravity = (Physics.GRAVITY.x, Physics.GRAVITY.y)
+
+        self.velocities[indices] += (self.forces[indices] *
+                                     self.inverse_masses[indices, None] +
+                                     gravity) * halfDeltaTime
+        self.angular_velocities[indices] += (self.torques[indices] *
+                                             self.inverse_inertias[indices] *
+                                             halfDeltaTime)
+
+    def integrate_velocity(self, indices, deltaTime):
+        """
+        Same as 'Physics.integrate_velocity' on each body. The
+        shapes still have to be told their new orientation.
+        @param { numpy.ndarray } indices : rows of the awake
+        dynamic bodies.
+        @param { float } deltaTime : time step.
+        """
+
+        self.positions[indices] += self.velocities[indices] * deltaTime
+        self.orientations[indices] += self.angular_velocities[indices] * deltaTime
+
+        self.integrate_forces(indices, deltaTime)
+
+    def clear_forces(self):
+        """Clear the force and torque of every body."""
+        count = len(self.bodies)
+        self.forces[:count] = 0.0
+        self.torques[:count] = 0.0
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    def grow(self):
+        """Double the rows of every array."""
+
+        capacity = 2 * max(len(self.inverse_masses), 1)
+
+        for name in ('positions', 'velocities', 'forces'):
+            array = numpy.zeros((capacity, 2))
+            old = getattr(self, name)
+            array[:len(old)] = old
+            setattr(self, name, array)
+
+        for name in ('orientations', 'angular_velocities', 'torques',
+                     'inverse_masses', 'inverse_inertias'):
+            array = numpy.zeros(capacity)
+            old = getattr(self, name)
+            array[:len(old)] = old
+            setattr(self, name, array)
+
+        # the vectors of the handles view the old arrays.
+        for handle in self.bodies:
+            handle.bind()
+
+    #====================
+    # setter / getter
+    def get_body_count(self):
+        return len(self.bodies)
+
+
+class StoredVector2(Vector2):
+    """
+    @class StoredVector2
+    @brief Vector2 reading and writing one row of a (n, 2) array
+    of a 'BodyStore'.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    __slots__ = ('array', 'index')
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, array, index):
+        """
+        Constructor.
+        @param { numpy.ndarray } array : (n, 2) array.
+        @param { int } index : row of the vector.
+        """
+        self.array = array
+        self.index = index
+
+    #====================
+    # setter / getter
+    @property
+    def x(self):
+        return self.array.item(self.index, 0)
+
+    @x.setter
+    def x(self, val):
+        self.array[self.index, 0] = val
+
+    @property
+    def y(self):
+        return self.array.item(self.index, 1)
+
+    @y.setter
+    def y(self, val):
+        self.array[self.index, 1] = val
+
+
+class BodyHandle(Rigidbody):
+    """
+    @class BodyHandle
+    @brief Rigidbody whose position, velocity, force, orientation,
+    angular velocity, torque, inverse mass and inverse inertia live
+    in a row of a 'BodyStore'. Use it the same as a Rigidbody.
+
+    Not created directly, 'BodyStore.add_body' change the class of
+    a Rigidbody to this one. Vectors read from the body before that
+    are no longer its position, velocity and force.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    # no slots of its own, the layout must match Rigidbody.
+    __slots__ = ()
+
+    #====================
+    # Public Methods
+    def attach(self, store, index):
+        """
+        Read and write the body's state from a row of the store.
+        @param { BodyStore } store : store holding the row.
+        @param { int } index : row of the body.
+        """
+        self.store = store
+        self.index = index
+
+        self.position_view = StoredVector2(store.positions, index)
+        self.velocity_view = StoredVector2(store.velocities, index)
+        self.force_view = StoredVector2(store.forces, index)
+
+    def bind(self):
+        """Point the vectors at the current arrays of the store,
+        after the store grew."""
+        self.position_view.array = self.store.positions
+        self.velocity_view.array = self.store.velocities
+        self.force_view.array = self.store.forces
+
+    #====================
+    # setter / getter
+    @property
+    def position(self):
+        return self.position_view
+
+    @position.setter
+    def position(self, val):
+        self.position_view.set_xy(val.x, val.y)
+
+    @property
+    def velocity(self):
+        return self.velocity_view
+
+    @velocity.setter
+    def velocity(self, val):
+        self.velocity_view.set_xy(val.x, val.y)
+
+    @property
+    def force(self):
+        return self.force_view
+
+    @force.setter
+    def force(self, val):
+        self.force_view.set_xy(val.x, val.y)
+
+    @property
+    def orientation(self):
+        return self.store.orientations.item(self.index)
+
+    @orientation.setter
+    def orientation(self, val):
+        self.store.orientations[self.index] = val
+
+    @property
+    def angular_velocity(self):
+        return self.store.angular_velocities.item(self.index)
+
+    @angular_velocity.setter
+    def angular_velocity(self, val):
+        self.store.angular_velocities[self.index] = val
+
+    @property
+    def torque(self):
+        return self.store.torques.item(self.index)
+
+    @torque.setter
+    def torque(self, val):
+        self.store.torques[self.index] = val
+
+    @property
+    def inverse_mass(self):
+        return self.store.inverse_masses.item(self.index)
+
+    @inverse_mass.setter
+    def inverse_mass(self, val):
+        self.store.inverse_masses[self.index] = val
+
+    @property
+    def inverse_inertia(self):
+        return self.store.inverse_inertias.item(self.index)
+
+    @inverse_inertia.setter
+    def inverse_inertia(self, val):
+        self.store.inverse_inertias[self.index] = val
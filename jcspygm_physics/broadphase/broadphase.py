@@ -0,0 +1,83 @@
+# ========================================================================
+# $File: broadphase.py $
+# $Date: 2026-10-18 09:40:22 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+
+class Broadphase(object):
+    """
+    @class Broadphase
+    @brief Broadphase base class. Find the pair of shapes that
+    might collide so the narrowphase does not have to test all
+    of them.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        # { Shape[] } : all the shapes in this broadphase.
+        self.shapes = []
+
+        # number of pair found by last 'compute_pairs' call.
+        self.pair_count = 0
+
+    #====================
+    # Public Methods
+    def add_shape(self, shape):
+        """
+        Add shape to the broadphase.
+        @param { Shape } shape : shape to add.
+        """
+        self.shapes.append(shape)
+
+    def remove_shape(self, shape):
+        """
+        Remove shape from the broadphase.
+        @param { Shape } shape : shape to remove.
+        """
+        self.shapes.remove(shape)
+
+    def update(self):
+        """Refresh the broadphase after the shapes have moved.
+
+        IMPORTANT: override this...
+        """
+
+    def compute_pairs(self):
+        """Return the list of shape pair that might collide.
+        Each pair is a tuple '(shapeA, shapeB)' where 'shapeA' was
+        added before 'shapeB'.
+
+        IMPORTANT: override this...
+        """
+        return []
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
+    def get_pair_count(self):
+        return self.pair_count
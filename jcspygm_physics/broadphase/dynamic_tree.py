@@ -0,0 +1,412 @@
+# ========================================================================
+# $File: dynamic_tree.py $
+# $Date: 2026-10-18 11:05:38 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.broadphase.broadphase import Broadphase
+from jcspygm_physics.aabb import AABB
+
+
+class TreeNode(object):
+    """
+    @class TreeNode
+    @brief Node in the dynamic tree. Leaf hold one shape, branch
+    hold two children.
+    """
+
+    def __init__(self):
+        """Constructor."""
+
+        # { AABB } : fat bounds for leaf, union of children for branch.
+        self.aabb = AABB()
+
+        self.parent = None
+        self.child1 = None
+        self.child2 = None
+
+        # leaf is 0.
+        self.height = 0
+
+        # leaf only.
+        self.shape = None
+        self.proxy_id = -1
+
+    def is_leaf(self):
+        return self.child1 is None
+
+
+class DynamicTree(Broadphase):
+    """
+    @class DynamicTree
+    @brief Dynamic bounding volume tree. Each leaf store a 'fat'
+    box enlarged by a margin so a moving shape only get re-insert
+    when it leave its fat box. Tree stay balanced with rotations.
+    Work well when huge static shapes mix with small ones.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    DEFAULT_MARGIN = 4.0
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, margin = DEFAULT_MARGIN):
+        """
+        Constructor.
+        @param { float } margin : how much the leaf boxes are
+        enlarged on each side.
+        """
+
+        super(DynamicTree, self).__init__()
+
+        self.margin = margin
+
+        self.root = None
+
+        # { Shape : TreeNode } : leaf of each shape.
+        self.leaves = {}
+        self.next_proxy_id = 0
+
+        # leaves re-insert by the last update.
+        self.reinsert_count = 0
+
+    #====================
+    # Public Methods
+    def add_shape(self, shape):
+        """
+        Add shape to the tree.
+        @param { Shape } shape : shape to add.
+        """
+        super(DynamicTree, self).add_shape(shape)
+
+        leaf = TreeNode()
+        leaf.shape = shape
+        leaf.proxy_id = self.next_proxy_id
+        self.next_proxy_id += 1
+
+        self.fatten(leaf)
+        self.insert_leaf(leaf)
+
+        self.leaves[shape] = leaf
+
+    def remove_shape(self, shape):
+        """
+        Remove shape from the tree.
+        @param { Shape } shape : shape to remove.
+        """
+        super(DynamicTree, self).remove_shape(shape)
+
+        self.remove_leaf(self.leaves.pop(shape))
+
+    def update(self):
+        """Re-insert the shapes that moved out of their fat box."""
+
+        self.reinsert_count = 0
+
+        for leaf in self.leaves.values():
+            if leaf.aabb.contains(leaf.shape.get_aabb()):
+                continue
+
+            self.remove_leaf(leaf)
+            self.fatten(leaf)
+            self.insert_leaf(leaf)
+            self.reinsert_count += 1
+
+    def compute_pairs(self):
+        """Return the list of shape pair with overlapping bounds."""
+
+        pairs = []
+        root = self.root
+
+        for leaf in self.leaves.values():
+            aabb = leaf.shape.aabb
+            proxy_id = leaf.proxy_id
+
+            stack = [root]
+            while stack:
+                node = stack.pop()
+
+                if not node.aabb.overlaps(aabb):
+                    continue
+
+                if node.child1 is None:
+                    # report each pair once, older shape first.
+                    if (node.proxy_id > proxy_id and
+                        node.shape.aabb.overlaps(aabb)):
+                        pairs.append((leaf.shape, node.shape))
+                else:
+                    stack.append(node.child1)
+                    stack.append(node.child2)
+
+        self.pair_count = len(pairs)
+        return pairs
+
+    def query_aabb(self, aabb):
+        """
+        Find all shapes whose bounds overlap the box.
+        @param { AABB } aabb : box in world space.
+        @return { Shape[] } : shapes found.
+        """
+
+        result = []
+        if self.root is None:
+            return result
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+
+            if not node.aabb.overlaps(aabb):
+                continue
+
+            if node.child1 is None:
+                if node.shape.get_aabb().overlaps(aabb):
+                    result.append(node.shape)
+            else:
+                stack.append(node.child1)
+                stack.append(node.child2)
+
+        return result
+
+    def query_point(self, x, y):
+        """
+        Find all shapes whose bounds contain the point.
+        @param { float } x : point on x-axis.
+        @param { float } y : point on y-axis.
+        @return { Shape[] } : shapes found.
+        """
+        return self.query_aabb(AABB(x, y, x, y))
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    def fatten(self, leaf):
+        """Set the leaf box to the shape bounds plus margin."""
+
+        aabb = leaf.shape.get_aabb()
+        margin = self.margin
+        leaf.aabb.set_bounds(
+            aabb.min_x - margin,
+            aabb.min_y - margin,
+            aabb.max_x + margin,
+            aabb.max_y + margin)
+
+    def insert_leaf(self, leaf):
+        """Insert leaf next to the sibling that cost the least."""
+
+        if self.root is None:
+            self.root = leaf
+            leaf.parent = None
+            return
+
+        leaf_aabb = leaf.aabb
+        combined = AABB()
+
+        # Find the best sibling by the surface area heuristic.
+        node = self.root
+        while not node.is_leaf():
+            area = node.aabb.perimeter()
+
+            combined.set_combine(node.aabb, leaf_aabb)
+            combined_area = combined.perimeter()
+
+            # Cost of creating a new parent for this node and the leaf
+            cost = 2.0 * combined_area
+
+            # Minimum cost of pushing the leaf further down the tree
+            inheritance_cost = 2.0 * (combined_area - area)
+
+            cost1 = self.descend_cost(node.child1, leaf_aabb, combined) + inheritance_cost
+            cost2 = self.descend_cost(node.child2, leaf_aabb, combined) + inheritance_cost
+
+            if cost < cost1 and cost < cost2:
+                break
+
+            if cost1 < cost2:
+                node = node.child1
+            else:
+                node = node.child2
+
+        sibling = node
+
+        # Create a new parent.
+        old_parent = sibling.parent
+        new_parent = TreeNode()
+        new_parent.parent = old_parent
+        new_parent.aabb.set_combine(leaf_aabb, sibling.aabb)
+        new_parent.height = sibling.height + 1
+
+        if old_parent is None:
+            self.root = new_parent
+        elif old_parent.child1 is sibling:
+            old_parent.child1 = new_parent
+        else:
+            old_parent.child2 = new_parent
+
+        new_parent.child1 = sibling
+        new_parent.child2 = leaf
+        sibling.parent = new_parent
+        leaf.parent = new_parent
+
+        self.refit(new_parent.parent)
+
+    def remove_leaf(self, leaf):
+        """Remove leaf and replace its parent by its sibling."""
+
+        if leaf is self.root:
+            self.root = None
+            return
+
+        parent = leaf.parent
+        grand_parent = parent.parent
+
+        if parent.child1 is leaf:
+            sibling = parent.child2
+        else:
+            sibling = parent.child1
+
+        leaf.parent = None
+
+        if grand_parent is None:
+            self.root = sibling
+            sibling.parent = None
+            return
+
+        if grand_parent.child1 is parent:
+            grand_parent.child1 = sibling
+        else:
+            grand_parent.child2 = sibling
+        sibling.parent = grand_parent
+
+        self.refit(grand_parent)
+
+    def descend_cost(self, child, leaf_aabb, combined):
+        """Cost of inserting the leaf under 'child'."""
+
+        combined.set_combine(leaf_aabb, child.aabb)
+
+        if child.is_leaf():
+            return combined.perimeter()
+
+        return combined.perimeter() - child.aabb.perimeter()
+
+    def refit(self, node):
+        """Walk back up the tree fixing heights and boxes."""
+
+        while node is not None:
+            node = self.balance(node)
+
+            child1 = node.child1
+            child2 = node.child2
+
+            node.height = 1 + max(child1.height, child2.height)
+            node.aabb.set_combine(child1.aabb, child2.aabb)
+
+            node = node.parent
+
+    def balance(self, nodeA):
+        """
+        Perform a left or right rotation if node A is imbalanced.
+        @return { TreeNode } : new root of this sub-tree.
+        """
+
+        if nodeA.is_leaf() or nodeA.height < 2:
+            return nodeA
+
+        nodeB = nodeA.child1
+        nodeC = nodeA.child2
+
+        balance = nodeC.height - nodeB.height
+
+        # Rotate C up
+        if balance > 1:
+            nodeF = nodeC.child1
+            nodeG = nodeC.child2
+
+            self.swap_with_parent(nodeA, nodeC)
+            nodeC.child1 = nodeA
+
+            if nodeF.height > nodeG.height:
+                nodeC.child2 = nodeF
+                nodeA.child2 = nodeG
+                nodeG.parent = nodeA
+            else:
+                nodeC.child2 = nodeG
+                nodeA.child2 = nodeF
+                nodeF.parent = nodeA
+
+            self.fix_node(nodeA)
+            self.fix_node(nodeC)
+            return nodeC
+
+        # Rotate B up
+        if balance < -1:
+            nodeD = nodeB.child1
+            nodeE = nodeB.child2
+
+            self.swap_with_parent(nodeA, nodeB)
+            nodeB.child1 = nodeA
+
+            if nodeD.height > nodeE.height:
+                nodeB.child2 = nodeD
+                nodeA.child1 = nodeE
+                nodeE.parent = nodeA
+            else:
+                nodeB.child2 = nodeE
+                nodeA.child1 = nodeD
+                nodeD.parent = nodeA
+
+            self.fix_node(nodeA)
+            self.fix_node(nodeB)
+            return nodeB
+
+        return nodeA
+
+    def swap_with_parent(self, nodeA, child):
+        """Make 'child' take the place of 'nodeA' under A's parent."""
+
+        child.parent = nodeA.parent
+        nodeA.parent = child
+
+        if child.parent is None:
+            self.root = child
+        elif child.parent.child1 is nodeA:
+            child.parent.child1 = child
+        else:
+            child.parent.child2 = child
+
+    def fix_node(self, node):
+        """Recompute height and box from the two children."""
+
+        node.height = 1 + max(node.child1.height, node.child2.height)
+        node.aabb.set_combine(node.child1.aabb, node.child2.aabb)
+
+    #====================
+    # setter / getter
+    def get_height(self):
+        """ @return { int } : height of the tree, leaf only is 0. """
+        if self.root is None:
+            return 0
+        return self.root.height
+
+    def set_margin(self, margin):
+        self.margin = margin
+
+    def get_margin(self):
+        return self.margin
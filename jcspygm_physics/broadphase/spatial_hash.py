@@ -0,0 +1,136 @@
+# ========================================================================
+# $File: spatial_hash.py $
+# $Date: 2026-10-18 09:52:17 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.broadphase.broadphase import Broadphase
+
+import math
+
+
+class SpatialHash(Broadphase):
+    """
+    @class SpatialHash
+    @brief Uniform grid broadphase. Every step the shapes are
+    bucket into grid cells by their world bounds, only shapes
+    sharing a cell become a candidate pair.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    DEFAULT_CELL_SIZE = 64.0
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, cell_size = DEFAULT_CELL_SIZE):
+        """
+        Constructor.
+        @param { float } cell_size : width and height of one cell.
+        Should be around the size of a common shape in the scene.
+        """
+
+        super(SpatialHash, self).__init__()
+
+        self.cell_size = float(cell_size)
+
+        # { (int, int) : int[] } : cell coordinate to shape indices.
+        self.cells = {}
+
+        # { (int, int, int, int)[] } : cell range of each shape.
+        self.cell_ranges = []
+
+    #====================
+    # Public Methods
+    def update(self):
+        """Re-bucket every shape by its current world bounds."""
+
+        cells = {}
+        cell_ranges = []
+        inv_cell_size = 1.0 / self.cell_size
+
+        for index in range(0, len(self.shapes)):
+            aabb = self.shapes[index].get_aabb()
+
+            x0 = int(math.floor(aabb.min_x * inv_cell_size))
+            y0 = int(math.floor(aabb.min_y * inv_cell_size))
+            x1 = int(math.floor(aabb.max_x * inv_cell_size))
+            y1 = int(math.floor(aabb.max_y * inv_cell_size))
+            cell_ranges.append((x0, y0, x1, y1))
+
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    key = (cx, cy)
+                    bucket = cells.get(key)
+                    if bucket is None:
+                        cells[key] = [index]
+                    else:
+                        bucket.append(index)
+
+        self.cells = cells
+        self.cell_ranges = cell_ranges
+
+    def compute_pairs(self):
+        """Return the list of shape pair sharing at least one cell
+        with overlapping bounds."""
+
+        pairs = []
+        shapes = self.shapes
+        cell_ranges = self.cell_ranges
+
+        for key, bucket in self.cells.items():
+            count = len(bucket)
+            if count < 2:
+                continue
+
+            cx, cy = key
+
+            for indexA in range(0, count):
+                tmpIndexA = bucket[indexA]
+                rangeA = cell_ranges[tmpIndexA]
+                aabbA = shapes[tmpIndexA].aabb
+
+                for indexB in range(indexA + 1, count):
+                    tmpIndexB = bucket[indexB]
+                    rangeB = cell_ranges[tmpIndexB]
+
+                    # Only report the pair from the first cell both
+                    # shapes share, so it does not come out twice.
+                    if (max(rangeA[0], rangeB[0]) != cx or
+                        max(rangeA[1], rangeB[1]) != cy):
+                        continue
+
+                    if not aabbA.overlaps(shapes[tmpIndexB].aabb):
+                        continue
+
+                    pairs.append((shapes[tmpIndexA], shapes[tmpIndexB]))
+
+        self.pair_count = len(pairs)
+        return pairs
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
+    def set_cell_size(self, cell_size):
+        self.cell_size = float(cell_size)
+
+    def get_cell_size(self):
+        return self.cell_size
@@ -0,0 +1,104 @@
+# ========================================================================
+# $File: static_index.py $
+# $Date: 2026-10-18 12:02:44 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.broadphase.dynamic_tree import DynamicTree
+
+
+class StaticIndex(object):
+    """
+    @class StaticIndex
+    @brief Index for static shapes only. Static shapes never move,
+    so the index is built once and only rebuilt when a static shape
+    is added or removed. Dynamic shapes query it instead of being
+    paired with every static shape.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        # { Shape[] } : all static shapes.
+        self.shapes = []
+
+        self.tree = DynamicTree(0.0)
+        self.dirty = False
+
+        # how many times the index has been built.
+        self.build_count = 0
+
+    #====================
+    # Public Methods
+    def add_shape(self, shape):
+        """
+        Add static shape, index is rebuilt on next query.
+        @param { Shape } shape : static shape.
+        """
+        self.shapes.append(shape)
+        self.dirty = True
+
+    def remove_shape(self, shape):
+        """
+        Remove static shape, index is rebuilt on next query.
+        @param { Shape } shape : static shape.
+        """
+        self.shapes.remove(shape)
+        self.dirty = True
+
+    def build(self):
+        """Build the index from all the static shapes."""
+
+        self.tree = DynamicTree(0.0)
+        for shape in self.shapes:
+            self.tree.add_shape(shape)
+
+        self.dirty = False
+        self.build_count += 1
+
+    def compute_pairs(self, dynamic_shapes):
+        """
+        Find the static shapes each dynamic shape might collide with.
+        @param { Shape[] } dynamic_shapes : shapes to test.
+        @return { (Shape, Shape)[] } : pairs of static and dynamic shape.
+        """
+
+        if self.dirty:
+            self.build()
+
+        pairs = []
+        if not self.shapes:
+            return pairs
+
+        for shape in dynamic_shapes:
+            for static_shape in self.tree.query_aabb(shape.get_aabb()):
+                pairs.append((static_shape, shape))
+
+        return pairs
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
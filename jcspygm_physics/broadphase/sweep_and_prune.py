@@ -0,0 +1,217 @@
+# ========================================================================
+# $File: sweep_and_prune.py $
+# $Date: 2026-10-18 10:24:51 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.broadphase.broadphase import Broadphase
+
+import jcspygm_physics.jcs_math
+
+
+class SapEndpoint(object):
+    """
+    @class SapEndpoint
+    @brief One end of a shape's bounds on one axis.
+    """
+
+    def __init__(self, proxy, is_max):
+        """Constructor."""
+
+        self.proxy = proxy
+        self.is_max = is_max
+        # start after everything, sorting move it into place.
+        self.value = jcspygm_physics.jcs_math.FLT_MAX
+
+
+class SapProxy(object):
+    """
+    @class SapProxy
+    @brief Shape record inside the sweep and prune.
+    """
+
+    def __init__(self, proxy_id, shape):
+        """Constructor."""
+
+        # increase by order of insertion, use to order the pair.
+        self.proxy_id = proxy_id
+        self.shape = shape
+
+        # one endpoint per axis, x first then y.
+        self.min_endpoints = [SapEndpoint(self, False), SapEndpoint(self, False)]
+        self.max_endpoints = [SapEndpoint(self, True), SapEndpoint(self, True)]
+
+
+class SweepAndPrune(Broadphase):
+    """
+    @class SweepAndPrune
+    @brief Incremental sweep and prune broadphase. Keep sorted
+    endpoint lists on both axis between steps, and keep the
+    overlapping pairs up to date from the swaps made while
+    re-sorting. Bodies barely move between frames so the insertion
+    sort is close to linear.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        super(SweepAndPrune, self).__init__()
+
+        # { SapEndpoint[][] } : sorted endpoints on x and y axis.
+        self.axes = [[], []]
+
+        # { Shape : SapProxy } : proxy of each shape.
+        self.proxies = {}
+        self.next_proxy_id = 0
+
+        # { (int, int) : (Shape, Shape) } : current overlapping pairs.
+        self.pairs = {}
+
+        # pair events made by the last update.
+        self.pair_added_count = 0
+        self.pair_removed_count = 0
+
+    #====================
+    # Public Methods
+    def add_shape(self, shape):
+        """
+        Add shape to the broadphase. The new endpoints start at the
+        end of the lists, next update sort them into place without
+        rebuilding the others.
+        @param { Shape } shape : shape to add.
+        """
+        super(SweepAndPrune, self).add_shape(shape)
+
+        proxy = SapProxy(self.next_proxy_id, shape)
+        self.next_proxy_id += 1
+        self.proxies[shape] = proxy
+
+        for axis in range(0, 2):
+            self.axes[axis].append(proxy.min_endpoints[axis])
+            self.axes[axis].append(proxy.max_endpoints[axis])
+
+    def remove_shape(self, shape):
+        """
+        Remove shape and all of its pairs from the broadphase.
+        @param { Shape } shape : shape to remove.
+        """
+        super(SweepAndPrune, self).remove_shape(shape)
+
+        proxy = self.proxies.pop(shape)
+
+        for axis in range(0, 2):
+            self.axes[axis].remove(proxy.min_endpoints[axis])
+            self.axes[axis].remove(proxy.max_endpoints[axis])
+
+        for key in list(self.pairs.keys()):
+            if proxy.proxy_id in key:
+                del self.pairs[key]
+
+    def update(self):
+        """Refresh endpoints from the current bounds, then re-sort."""
+
+        self.pair_added_count = 0
+        self.pair_removed_count = 0
+
+        for proxy in self.proxies.values():
+            aabb = proxy.shape.get_aabb()
+            proxy.min_endpoints[0].value = aabb.min_x
+            proxy.max_endpoints[0].value = aabb.max_x
+            proxy.min_endpoints[1].value = aabb.min_y
+            proxy.max_endpoints[1].value = aabb.max_y
+
+        for axis in range(0, 2):
+            self.sort_axis(self.axes[axis])
+
+    def compute_pairs(self):
+        """Return the current overlapping pairs."""
+
+        pairs = list(self.pairs.values())
+        self.pair_count = len(pairs)
+        return pairs
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    def sort_axis(self, endpoints):
+        """
+        Insertion sort the endpoints on one axis. Every swap
+        between a min and a max endpoint is where two shapes start
+        or stop overlapping on this axis.
+        @param { SapEndpoint[] } endpoints : endpoints of one axis.
+        """
+
+        for index in range(1, len(endpoints)):
+            endpoint = endpoints[index]
+            value = endpoint.value
+            is_max = endpoint.is_max
+
+            index2 = index - 1
+            while index2 >= 0:
+                prev = endpoints[index2]
+
+                # min go before max when equal, touching count
+                # as overlapping.
+                if (prev.value < value or
+                    (prev.value == value and (is_max or not prev.is_max))):
+                    break
+
+                if is_max != prev.is_max:
+                    if is_max:
+                        # max move before a min, stop overlapping.
+                        self.remove_pair(endpoint.proxy, prev.proxy)
+                    else:
+                        # min move before a max, start overlapping.
+                        self.add_pair(endpoint.proxy, prev.proxy)
+
+                endpoints[index2 + 1] = prev
+                index2 -= 1
+
+            endpoints[index2 + 1] = endpoint
+
+    def add_pair(self, proxyA, proxyB):
+        """Add the pair if the bounds overlap on both axis."""
+
+        if not proxyA.shape.aabb.overlaps(proxyB.shape.aabb):
+            return
+
+        if proxyA.proxy_id > proxyB.proxy_id:
+            proxyA, proxyB = proxyB, proxyA
+
+        key = (proxyA.proxy_id, proxyB.proxy_id)
+        if key not in self.pairs:
+            self.pairs[key] = (proxyA.shape, proxyB.shape)
+            self.pair_added_count += 1
+
+    def remove_pair(self, proxyA, proxyB):
+        """Remove the pair if it exists."""
+
+        if proxyA.proxy_id > proxyB.proxy_id:
+            proxyA, proxyB = proxyB, proxyA
+
+        key = (proxyA.proxy_id, proxyB.proxy_id)
+        if self.pairs.pop(key, None) is not None:
+            self.pair_removed_count += 1
+
+    #====================
+    # setter / getter
@@ -9,13 +9,16 @@
 
 import jcs_math
 
-import vector2
-
+import logging
 import math
 import sys
 
 from jcspygm_physics.physics import Physics
-from jcspygm_physics.vector2 import Vector2
+from jcspygm_physics.scratch_pool import ScratchPool
+from jcspygm_physics.enum.shape_type import ShapeType
+from jcspygm_physics.gjk import GJK
+
+logger = logging.getLogger(__name__)
 
 
 class Collision(object):
@@ -28,6 +31,40 @@ class Collision(object):
     # Public Variables
     # --------------------------------------------
 
+    # Feature of a polygon contact that is not an incident vertex
+    # but made by clipping against a reference face side plane.
+    # Vertex index never reach these, max vertex count is 64.
+    FEATURE_CLIP_NEGATIVE = 64
+    FEATURE_CLIP_POSITIVE = 65
+
+    # Circle touching a polygon vertex instead of a face.
+    FEATURE_VERTEX_OFFSET = 128
+
+    # Alignment difference under which 'polygon_to_polygon_gjk'
+    # keep polygon A as the reference.
+    FACE_ALIGN_TOLERANCE = 1.0e-9
+
+    # Which shape own the separating axis cached in the manifold.
+    SEPARATING_NONE = 0
+    SEPARATING_SHAPE_A = 1
+    SEPARATING_SHAPE_B = 2
+
+    # Separating axis cache result, count until 'reset_counters'.
+    axis_cache_hit_count = 0
+    axis_cache_miss_count = 0
+
+    # Pairs rejected by the bounding circle test, count until
+    # 'reset_counters'.
+    bounding_reject_count = 0
+
+    # { (int, int) : function } : collider of each pair of shape
+    # type, fill by 'register'.
+    colliders = {}
+
+    # Temporaries of the colliders and the solver, the manifold
+    # keep its own normal and contacts and they are copied in.
+    scratch_pool = ScratchPool()
+
     # --------------------------------------------
     # Private Variables
     # --------------------------------------------
@@ -43,6 +80,65 @@ class Collision(object):
     # --------------------------------------------
     # Public Methods
     # --------------------------------------------
+    @staticmethod
+    def register(typeA, typeB, collider):
+        """Register the collider of a pair of shape type. The
+        swapped pair is registered too, it call the collider with
+        the shapes swapped and flip the normal back.
+
+        @param { ShapeType } typeA : type of the first shape.
+        @param { ShapeType } typeB : type of the second shape.
+        @param { function } collider : collider(manifold, shapeA, shapeB)
+        that fill the manifold.
+        """
+        Collision.colliders[(typeA, typeB)] = collider
+
+        if typeA != typeB:
+            Collision.colliders[(typeB, typeA)] = Collision.make_swapped(collider)
+
+    @staticmethod
+    def make_swapped(collider):
+        """Wrap collider so it can be call with the shapes swapped.
+
+        @param { function } collider : collider to wrap.
+        @return { function } : collider(manifold, shapeB, shapeA).
+        """
+        def swapped(manifold, shapeB, shapeA):
+            collider(manifold, shapeA, shapeB)
+            manifold.normal *= -1.0
+        return swapped
+
+    @staticmethod
+    def get_collider(typeA, typeB):
+        """
+        @param { ShapeType } typeA : type of the first shape.
+        @param { ShapeType } typeB : type of the second shape.
+        @return { function } : collider of the pair, None if no
+        collider is registered.
+        """
+        return Collision.colliders.get((typeA, typeB))
+
+    @staticmethod
+    def bounding_circles_overlap(shapeA, shapeB):
+        """Cheap test before any collider, compare the distance of
+        the two body positions with the bounding radius.
+
+        @param { Shape } shapeA : first shape.
+        @param { Shape } shapeB : second shape.
+        @return { bool } : False if the shapes can not touch.
+        """
+        posA = shapeA.rigidbody.position
+        posB = shapeB.rigidbody.position
+        dx = posB.x - posA.x
+        dy = posB.y - posA.y
+        radius = shapeA.bounding_radius + shapeB.bounding_radius
+
+        if dx * dx + dy * dy > radius * radius:
+            Collision.bounding_reject_count += 1
+            return False
+
+        return True
+
     @staticmethod
     def circle_to_circle(manifold, circA, circB):
         """Do collision check on two circle.
@@ -54,10 +150,13 @@ class Collision(object):
         """
 
         # Calculate translational vector, which is normal
-        normal = circB.get_position() - circA.get_position()
+        posA = circA.rigidbody.position
+        posB = circB.rigidbody.position
+        nx = posB.x - posA.x
+        ny = posB.y - posA.y
 
-        dist_sqr = normal.len_sqr()
-        radius = circA.get_radius() + circB.get_radius()
+        dist_sqr = nx * nx + ny * ny
+        radius = circA.radius + circB.radius
 
         # Not in contact
         if dist_sqr >= jcs_math.sqr(radius):
@@ -68,18 +167,22 @@ class Collision(object):
 
         manifold.set_contact_count(1)
 
+        # only one feature between two circles.
+        manifold.feature_ids[0] = 0
+
         if distance == 0:
-            manifold.set_penetration(circA.get_radius())
-            manifold.set_normal(vector2.Vector2(1, 0))
-            manifold.set_contacts_at(0, circA.get_position())
+            manifold.penetration = circA.radius
+            manifold.normal.set_xy(1.0, 0.0)
+            manifold.contacts[0].set_xy(posA.x, posA.y)
         else:
-            manifold.set_penetration(radius - distance)
+            manifold.penetration = radius - distance
             # aster than using Normalized since we already
             # performed sqrt
-            manifold.set_normal(normal / distance)
-
-            tmpContact = manifold.get_normal() * circA.get_radius() + circA.get_position()
-            manifold.set_contacts_at(0, tmpContact)
+            nx /= distance
+            ny /= distance
+            manifold.normal.set_xy(nx, ny)
+            manifold.contacts[0].set_xy(nx * circA.radius + posA.x,
+                                        ny * circA.radius + posA.y)
 
     @staticmethod
     def circle_to_polygon(manifold, circ, poly):
@@ -91,24 +194,27 @@ class Collision(object):
         @param { Polygon } poly: Polygon to check collide with circle.
         """
 
-        circBody = circ.get_rigidbody()
-        polyBody = poly.get_rigidbody()
+        circBody = circ.rigidbody
 
         manifold.contact_count = 0
 
-        # Transform circle center to Polygon model space
-        center = (poly.orientation.transpose() *
-                  (circBody.get_position() - polyBody.get_position()))
+        # Work in world space with the polygon's cached transform
+        center = circBody.position
+        world_vertices = poly.get_world_vertices()
+        world_normals = poly.get_world_normals()
 
         # Find edge with minimum penetration
         # Exact concept as using support points in Polygon vs Polygon
         separation = -jcs_math.FLT_MAX
         face_normal = 0
+        radius = circ.radius
 
         for index in range(0, poly.get_vertex_count()):
-            s = jcs_math.dot_product(poly.normals[index], center - poly.vertices[index])
+            n = world_normals[index]
+            v = world_vertices[index]
+            s = n.x * (center.x - v.x) + n.y * (center.y - v.y)
 
-            if s > circ.get_radius():
+            if s > radius:
                 return
 
             if s > separation:
@@ -116,60 +222,64 @@ class Collision(object):
                 face_normal = index
 
         # Grab face's vertices
-        v1 = poly.vertices[face_normal]
+        v1 = world_vertices[face_normal]
         if face_normal + 1 < poly.get_vertex_count():
             i2 = face_normal + 1
         else:
             i2 = 0
-        v2 = poly.vertices[i2]
+        v2 = world_vertices[i2]
 
         # Check to see if center is within polygon
         if separation < Physics.EPSILON:
+            n = world_normals[face_normal]
             manifold.contact_count = 1
-            manifold.normal = -(poly.orientation * poly.normals[face_normal])
-            manifold.contacts[0] = manifold.normal * circ.get_radius() + circBody.get_position()
-            manifold.penetration = circ.get_radius()
+            manifold.feature_ids[0] = face_normal
+            manifold.normal.set_xy(-n.x, -n.y)
+            manifold.contacts[0].set_xy(center.x - n.x * radius,
+                                        center.y - n.y * radius)
+            manifold.penetration = radius
             return
 
-        dot1 = jcs_math.dot_product(center - v1, v2 - v1)
-        dot2 = jcs_math.dot_product(center - v2, v1 - v2)
-        manifold.penetration = circ.get_radius() - separation
+        edge_x = v2.x - v1.x
+        edge_y = v2.y - v1.y
+        dot1 = (center.x - v1.x) * edge_x + (center.y - v1.y) * edge_y
+        dot2 = -((center.x - v2.x) * edge_x + (center.y - v2.y) * edge_y)
+        manifold.penetration = circ.radius - separation
 
         # Close to v1
         if dot1 <= 0.0:
-            if Physics.dist_sqr(center, v1) > circ.get_radius() * circ.get_radius():
+            if Physics.dist_sqr(center, v1) > radius * radius:
                 return
 
             manifold.contact_count = 1
-            n = poly.orientation * (v1 - center)
-            n.normalize()
-            manifold.normal = n
-            v1 = poly.orientation * v1 + polyBody.get_position()
-            manifold.contacts[0] = v1
+            manifold.feature_ids[0] = Collision.FEATURE_VERTEX_OFFSET + face_normal
+            manifold.normal.set_xy(v1.x - center.x, v1.y - center.y)
+            manifold.normal.normalize()
+            manifold.contacts[0].set_xy(v1.x, v1.y)
 
         # Close to v2
         elif dot2 <= 0.0:
-            if Physics.dist_sqr(center, v2) > circ.get_radius() * circ.get_radius():
+            if Physics.dist_sqr(center, v2) > radius * radius:
                 return
 
             manifold.contact_count = 1
-            v2 = poly.orientation * v2 + polyBody.get_position()
-            manifold.contacts[0] = v2
+            manifold.feature_ids[0] = Collision.FEATURE_VERTEX_OFFSET + i2
+            manifold.contacts[0].set_xy(v2.x, v2.y)
 
-            n = poly.orientation * (v2 - center)
-            n.normalize()
-            manifold.normal = n
+            manifold.normal.set_xy(v2.x - center.x, v2.y - center.y)
+            manifold.normal.normalize()
 
         # Closest to face
         else:
-            n = poly.normals[face_normal]
-            if jcs_math.dot_product(center - v1, n) > circ.get_radius():
+            n = world_normals[face_normal]
+            if (center.x - v1.x) * n.x + (center.y - v1.y) * n.y > radius:
                 return
 
-            n = poly.orientation * n
-            manifold.normal = -n
-            manifold.contacts[0] = manifold.normal * circ.get_radius() + circBody.get_position()
+            manifold.normal.set_xy(-n.x, -n.y)
+            manifold.contacts[0].set_xy(center.x - n.x * radius,
+                                        center.y - n.y * radius)
             manifold.contact_count = 1
+            manifold.feature_ids[0] = face_normal
 
     @staticmethod
     def polygon_to_circle(manifold, poly, circ):
@@ -181,7 +291,7 @@ class Collision(object):
         @param { Circle } circ: Circle to check collide with Polygon.
         """
         Collision.circle_to_polygon(manifold, circ, poly)
-        manifold.normal = -manifold.normal
+        manifold.normal *= -1.0
 
     @staticmethod
     def polygon_to_polygon(manifold, polyA, polyB):
@@ -193,22 +303,39 @@ class Collision(object):
         @param { Polygon } polyB: Polygon B to check collide with polygon A.
         """
 
-        bodyA = polyA.get_rigidbody()
-        bodyB = polyB.get_rigidbody()
-
         manifold.contact_count = 0
 
-        # Check for a separating axis with A's face planes
+        # Try the axis that separated this pair last step first,
+        # pairs that stay apart usually stay apart on the same axis.
+        if manifold.separating_shape != Collision.SEPARATING_NONE:
+            if manifold.separating_shape == Collision.SEPARATING_SHAPE_A:
+                separation = Collision.face_separation(
+                    polyA, polyB, manifold.separating_face)
+            else:
+                separation = Collision.face_separation(
+                    polyB, polyA, manifold.separating_face)
+
+            if separation >= 0.0:
+                Collision.axis_cache_hit_count += 1
+                return
 
+            Collision.axis_cache_miss_count += 1
+            manifold.separating_shape = Collision.SEPARATING_NONE
+
+        # Check for a separating axis with A's face planes
         penetrationA, faceA = Collision.find_axis_least_penetration(
             polyA, polyB)
         if penetrationA >= 0.0:
+            manifold.separating_shape = Collision.SEPARATING_SHAPE_A
+            manifold.separating_face = faceA
             return
 
         # Check for a separating axis with B's face planes
         penetrationB, faceB = Collision.find_axis_least_penetration(
             polyB, polyA)
         if penetrationB >= 0.0:
+            manifold.separating_shape = Collision.SEPARATING_SHAPE_B
+            manifold.separating_face = faceB
             return
 
         reference_index = 0
@@ -229,16 +356,100 @@ class Collision(object):
             reference_index = faceB
             flip = True
 
+        Collision.clip_contacts(manifold, ref_poly, inc_poly,
+                                reference_index, flip)
+
+    @staticmethod
+    def polygon_to_polygon_gjk(manifold, polyA, polyB):
+        """Do collision check with two polygon using GJK and EPA.
+        Every query walk the hulls with hill climbing support, so
+        it cost about linear in the vertex count instead of the
+        quadratic face by face test of 'polygon_to_polygon'. Worth
+        it for polygons with many vertices, enable it with
+
+            Collision.register(ShapeType.POLYGON, ShapeType.POLYGON,
+                               Collision.polygon_to_polygon_gjk)
+
+        @param { Manifold } manifold : information about a
+        collision between two objects.
+        @param { Polygon } polyA: Polygon A to check collide with polygon B.
+        @param { Polygon } polyB: Polygon B to check collide with polygon A.
+        """
+        manifold.contact_count = 0
+
+        simplex = []
+        if not GJK.intersect(polyA, polyB, simplex):
+            return
+
+        normal = GJK.penetration_normal(polyA, polyB, simplex)
+
+        # Reference face is the face most facing the normal, on A
+        # along the normal or on B against it. Alignments are dots
+        # close to 1, compare them directly, A win a tie so the
+        # choice does not flicker between steps.
+        faceA, alignA = Collision.find_aligned_face(polyA, normal.x, normal.y)
+        faceB, alignB = Collision.find_aligned_face(polyB, -normal.x, -normal.y)
+
+        if alignA >= alignB - Collision.FACE_ALIGN_TOLERANCE:
+            Collision.clip_contacts(manifold, polyA, polyB, faceA, False)
+        else:
+            Collision.clip_contacts(manifold, polyB, polyA, faceB, True)
+
+    @staticmethod
+    def find_aligned_face(poly, dx, dy):
+        """Find the face whose normal is closest to a direction.
+
+        @param { Polygon } poly : polygon to search.
+        @param { float } dx : direction on x-axis.
+        @param { float } dy : direction on y-axis.
+        @return { (int, float) } : face index and its normal dot
+        the direction.
+        """
+        normals = poly.get_world_normals()
+
+        best_index = 0
+        best_dot = -jcs_math.FLT_MAX
+        for index in range(0, poly.vertex_count):
+            n = normals[index]
+            dot = n.x * dx + n.y * dy
+            if dot > best_dot:
+                best_dot = dot
+                best_index = index
+
+        return best_index, best_dot
+
+    @staticmethod
+    def clip_contacts(manifold, ref_poly, inc_poly, reference_index, flip):
+        """Build the contacts by clipping the incident face against
+        the reference face.
+
+        @param { Manifold } manifold : information about a
+        collision between two objects.
+        @param { Polygon } ref_poly : polygon own the reference face.
+        @param { Polygon } inc_poly : polygon own the incident face.
+        @param { int } reference_index : reference face index.
+        @param { bool } flip : True if reference face is on shape B.
+        """
+
+        pool = Collision.scratch_pool
+        mark = pool.mark()
+
         # World space incident face
-        incident_face = []
-        for count in range(0, 2):
-            incident_face.append(Vector2())
-        Collision.find_incident_face(
+        incident_face = [pool.borrow(), pool.borrow()]
+        incident_index = Collision.find_incident_face(
             incident_face,
             ref_poly,
             inc_poly,
             reference_index)
 
+        # Feature of each incident face point, use to match the
+        # contacts with last step for warm starting.
+        if incident_index + 1 >= inc_poly.vertex_count:
+            incident_ids = [incident_index, 0]
+        else:
+            incident_ids = [incident_index, incident_index + 1]
+        reference_face = reference_index
+
         #        y
         #        ^  ->n       ^
         #      +---c ------posPlane--
@@ -252,26 +463,23 @@ class Collision(object):
         #  c : clipped point
         #  n : incident normal
 
-        # Setup reference face vertices
-        v1 = ref_poly.vertices[reference_index]
+        # Setup reference face vertices, already in world space
+        ref_vertices = ref_poly.get_world_vertices()
+        v1 = ref_vertices[reference_index]
 
         if reference_index + 1 == ref_poly.vertex_count:
             reference_index = 0
         else:
             reference_index += 1
 
-        v2 = ref_poly.vertices[reference_index]
-
-        # Transform vertices to world space
-        v1 = ref_poly.orientation * v1 + ref_poly.get_rigidbody().get_position()
-        v2 = ref_poly.orientation * v2 + ref_poly.get_rigidbody().get_position()
+        v2 = ref_vertices[reference_index]
 
         # Calculate reference face side normal in world space
-        side_plane_normal = (v2 - v1)
+        side_plane_normal = pool.borrow(v2.x - v1.x, v2.y - v1.y)
         side_plane_normal.normalize()
 
         # Orthogonalize
-        ref_face_normal = Vector2(side_plane_normal.y, -side_plane_normal.x)
+        ref_face_normal = pool.borrow(side_plane_normal.y, -side_plane_normal.x)
 
         # ax + by = c
         # c is distance from origin
@@ -280,24 +488,31 @@ class Collision(object):
         pos_side = jcs_math.dot_product(side_plane_normal, v2)
 
         # Clip incident face to reference face side planes
-        if Collision.clip(-side_plane_normal, neg_side, incident_face) < 2:
+        neg_plane_normal = pool.borrow(-side_plane_normal.x, -side_plane_normal.y)
+        if Collision.clip(neg_plane_normal, neg_side, incident_face,
+                          incident_ids, Collision.FEATURE_CLIP_NEGATIVE) < 2:
             # Due to floating point error, possible to not have required points
+            pool.release(mark)
             return;
-        if Collision.clip(side_plane_normal, pos_side, incident_face) < 2:
+        if Collision.clip(side_plane_normal, pos_side, incident_face,
+                          incident_ids, Collision.FEATURE_CLIP_POSITIVE) < 2:
             # Due to floating point error, possible to not have required points
+            pool.release(mark)
             return;
 
         # Flip
         if flip is True:
-            manifold.normal = -ref_face_normal
+            manifold.normal.set_xy(-ref_face_normal.x, -ref_face_normal.y)
         else:
-            manifold.normal = ref_face_normal
+            manifold.normal.set_xy(ref_face_normal.x, ref_face_normal.y)
 
         # Keep points behind reference face
         cp = 0  # clipped points behind reference face
         separation = jcs_math.dot_product(ref_face_normal, incident_face[0]) - refC
         if separation <= 0.0:
-            manifold.contacts[cp] = incident_face[0]
+            manifold.contacts[cp].set_xy(incident_face[0].x, incident_face[0].y)
+            manifold.feature_ids[cp] = Collision.make_feature_id(
+                reference_face, incident_ids[0], flip)
             manifold.penetration = -separation
             cp += 1
         else:
@@ -305,7 +520,9 @@ class Collision(object):
 
         separation = jcs_math.dot_product(ref_face_normal, incident_face[1]) - refC
         if separation <= 0.0:
-            manifold.contacts[cp] = incident_face[1]
+            manifold.contacts[cp].set_xy(incident_face[1].x, incident_face[1].y)
+            manifold.feature_ids[cp] = Collision.make_feature_id(
+                reference_face, incident_ids[1], flip)
             manifold.penetration += -separation
             cp += 1
 
@@ -314,10 +531,13 @@ class Collision(object):
 
         manifold.contact_count = cp
 
+        pool.release(mark)
+
     @staticmethod
     def find_axis_least_penetration(polyA, polyB):
         """
-        Find axis the least penetration.
+        Find axis the least penetration. Use the world space
+        vertices and normals cached on both polygons.
 
         @param { Polygon } polyA : polygon shape A.
         @param { Polygon } polyB : polygon shape B.
@@ -328,25 +548,7 @@ class Collision(object):
         best_index = 0
 
         for index in range(0, polyA.vertex_count):
-            # Retrieve a face normal from A
-            n = polyA.normals[index]
-            nw = polyA.orientation * n
-
-            # Transform face normal into B's model space
-            buT = polyB.orientation.transpose()
-            n = buT * nw
-
-            # Retrieve support point from B along -n
-            s = polyB.get_support(-n)
-
-            # Retrieve vertex on face from A, transform into
-            # B's model space
-            v = polyA.orientation * polyA.vertices[index] + polyA.get_rigidbody().get_position()
-            v -= polyB.get_rigidbody().get_position()
-            v = buT * v
-
-            # Compute penetration distance (in B's model space)
-            d = jcs_math.dot_product(n, s - v)
+            d = Collision.face_separation(polyA, polyB, index)
 
             # Store greatest distance
             if d > best_distance:
@@ -356,14 +558,69 @@ class Collision(object):
         return best_distance , best_index
 
     @staticmethod
-    def clip(n, c, face):
-        """Clip"""
+    def face_separation(polyA, polyB, index):
+        """
+        Distance of polygon B in front of one face of polygon A,
+        negative when B cross the face plane.
+
+        @param { Polygon } polyA : polygon own the face.
+        @param { Polygon } polyB : polygon to test.
+        @param { int } index : face index on polygon A.
+        @return { float } : separation along the face normal.
+        """
+
+        # Retrieve a face normal from A
+        n = polyA.get_world_normals()[index]
+        nx = n.x
+        ny = n.y
+
+        # Retrieve support point from B along -n, faces are visited
+        # in order so the hill climbing start next to the answer.
+        support = polyB.get_world_vertices()[
+            polyB.get_world_support_index(-nx, -ny)]
+
+        # Compute penetration distance against the face of A
+        v = polyA.get_world_vertices()[index]
+        return nx * (support.x - v.x) + ny * (support.y - v.y)
+
+    @staticmethod
+    def reset_counters():
+        """Clear the separating axis cache counters."""
+        Collision.axis_cache_hit_count = 0
+        Collision.axis_cache_miss_count = 0
+        Collision.bounding_reject_count = 0
+
+    @staticmethod
+    def make_feature_id(reference_face, feature, flip):
+        """
+        Pack a polygon contact feature into one integer.
+
+        @param { int } reference_face : reference face index.
+        @param { int } feature : incident vertex index or clip feature.
+        @param { bool } flip : True if reference face is on shape B.
+        @return { int } : feature id.
+        """
+        return (reference_face << 8) | (feature << 1) | int(flip)
+
+    @staticmethod
+    def clip(n, c, face, face_ids, clip_id):
+        """Clip
+
+        @param { Vector2[] } face : two points, clipped in place. The
+        point made by the clipping is borrowed from 'scratch_pool'.
+        @param { int[] } face_ids : feature of each point, point made
+        by the clipping get 'clip_id'.
+        """
 
         sp = 0
         out = [
             face[0],
             face[1]
         ]
+        out_ids = [
+            face_ids[0],
+            face_ids[1]
+        ]
 
         # Retrieve distances from each endpoint to the line
         # d = ax + by - c
@@ -373,25 +630,32 @@ class Collision(object):
         # If negative (behind plane) clip
         if d1 <= 0.0:
             out[sp] = face[0]
+            out_ids[sp] = face_ids[0]
             sp += 1
 
         if d2 <= 0.0:
             out[sp] = face[1]
+            out_ids[sp] = face_ids[1]
             sp += 1
 
         # If the points are on different sides of the plane
         if d1 * d2 < 0.0:  # less than to ignore -0.0f
             # Push interesction point
             alpha = d1 / (d1 - d2)
-            out[sp] = face[0] + alpha * (face[1] - face[0])
+            out[sp] = Collision.scratch_pool.borrow(
+                face[0].x + alpha * (face[1].x - face[0].x),
+                face[0].y + alpha * (face[1].y - face[0].y))
+            out_ids[sp] = clip_id
             sp += 1
 
         # Assign our new converted values
         face[0] = out[0]
         face[1] = out[1]
+        face_ids[0] = out_ids[0]
+        face_ids[1] = out_ids[1]
 
         if (sp != 3) is False:
-            JCSPyGm_Debug.Error("'sp' is equal to 3...")
+            logger.error("'sp' is equal to 3...")
 
         return sp
 
@@ -403,39 +667,36 @@ class Collision(object):
         @param { Vector2[] } v : incident face list.
         @param { Polygon } ref_poly : reference polygon shape.
         @param { Polygon } inc_poly : incident polygon shape.
+        @return { int } : index of the incident face.
         """
 
-        reference_normal = ref_poly.normals[reference_index]
-
-        # Calculate normal in incident's frame of reference
-        # To world space
-        reference_normal = ref_poly.orientation * reference_normal
-        # To incident's model space
-        reference_normal = inc_poly.orientation.transpose() * reference_normal
+        # Reference normal in world space
+        reference_normal = ref_poly.get_world_normals()[reference_index]
+        inc_normals = inc_poly.get_world_normals()
 
         # Find most anti-normal face on incident polygon
         incident_face = 0
         min_dot = jcs_math.FLT_MAX
 
         for index in range(0, inc_poly.vertex_count):
-            dot = jcs_math.dot_product(reference_normal, inc_poly.normals[index])
+            dot = jcs_math.dot_product(reference_normal, inc_normals[index])
             if dot < min_dot:
                 min_dot = dot
                 incident_face = index
 
-        # Assign face vertices for 'incident_face'
-        v[0] = (inc_poly.orientation *
-                inc_poly.vertices[incident_face] +
-                inc_poly.get_rigidbody().get_position())
+        # Assign face vertices for 'incident_face', copy them because
+        # clipping change the points.
+        inc_vertices = inc_poly.get_world_vertices()
+        v[0].set_xy(inc_vertices[incident_face].x, inc_vertices[incident_face].y)
 
         if incident_face + 1 >= int(inc_poly.vertex_count):
-            incident_face = 0
+            next_face = 0
         else:
-            incident_face += 1
+            next_face = incident_face + 1
 
-        v[1] = (inc_poly.orientation *
-                inc_poly.vertices[incident_face] +
-                inc_poly.get_rigidbody().get_position())
+        v[1].set_xy(inc_vertices[next_face].x, inc_vertices[next_face].y)
+
+        return incident_face
 
 
     # --------------------------------------------
@@ -449,3 +710,9 @@ class Collision(object):
     # --------------------------------------------
     # setter / getter
     # --------------------------------------------
+
+
+# Default colliders, polygon to circle is the swapped circle to polygon.
+Collision.register(ShapeType.CIRCLE, ShapeType.CIRCLE, Collision.circle_to_circle)
+Collision.register(ShapeType.CIRCLE, ShapeType.POLYGON, Collision.circle_to_polygon)
+Collision.register(ShapeType.POLYGON, ShapeType.POLYGON, Collision.polygon_to_polygon)
@@ -0,0 +1,89 @@
+# ========================================================================
+# $File: contact_coloring.py $
+# $Date: 2026-10-18 20:58:12 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+
+class ContactColoring(object):
+    """
+    @class ContactColoring
+    @brief Colour the contact graph, bodies are the vertices and
+    contacts the edges. Contacts of one colour never share a dynamic
+    body, so a whole colour can be solved at once and still give the
+    same result as solving its contacts one after the other.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+
+    #====================
+    # Public Methods
+    @staticmethod
+    def color(contacts):
+        """
+        Greedy colouring, each contact take the lowest colour its
+        two bodies are not using yet. Static bodies are never
+        updated by the solver so they can be in every colour.
+        @param { Manifold[] } contacts : contacts to colour.
+        @return { Manifold[][] } : one batch of contacts per colour,
+        first colours are the biggest.
+        """
+
+        # { Rigidbody : int } : bit mask of the colours of each body.
+        body_colors = {}
+        batches = []
+
+        for contact in contacts:
+            bodyA = contact.bodyA
+            bodyB = contact.bodyB
+            dynamicA = bodyA.inverse_mass != 0.0
+            dynamicB = bodyB.inverse_mass != 0.0
+
+            used = 0
+            if dynamicA:
+                used |= body_colors.get(bodyA, 0)
+            if dynamicB:
+                used |= body_colors.get(bodyB, 0)
+
+            # lowest bit not set
+            color_bit = ~used & (used + 1)
+            color = color_bit.bit_length() - 1
+
+            if color == len(batches):
+                batches.append([])
+            batches[color].append(contact)
+
+            if dynamicA:
+                body_colors[bodyA] = body_colors.get(bodyA, 0) | color_bit
+            if dynamicB:
+                body_colors[bodyB] = body_colors.get(bodyB, 0) | color_bit
+
+        # greedy does not always fill the lower colours most.
+        batches.sort(key = len, reverse = True)
+        return batches
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
@@ -0,0 +1,374 @@
+# ========================================================================
+# $File: contact_solver.py $
+# $Date: 2026-10-18 20:12:35 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ContactSolver(object):
+    """
+    @class ContactSolver
+    @brief Impulse solver working on flat NumPy arrays instead of
+    one 'Manifold.apply_impulse' call per contact. Every contact
+    point of the step is packed once, all of them are solved
+    together each iteration, and velocities and impulses are
+    written back once at the end.
+
+    Contacts are solved in batches, one batch after the other.
+    Contacts of a batch that share a body use mass splitting, each
+    contact see the body as if its mass was split between them, so
+    one batch of every contact is a Jacobi iteration that still
+    converge. Batches from 'ContactColoring' share no body and give
+    the Gauss-Seidel convergence of the per contact solver.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    HAS_NUMPY = numpy is not None
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        # { Rigidbody[] } : body of each body index.
+        self.bodies = []
+
+        # Body arrays, (n,) or (n, 2).
+        self.velocities = None
+        self.angular_velocities = None
+        self.inverse_masses = None
+        self.inverse_inertias = None
+
+        # { Manifold[] } : manifold of each contact point, and the
+        # point index inside it.
+        self.point_manifolds = []
+        self.point_indices = []
+
+        # { numpy.ndarray[] } : contact points of each batch.
+        self.point_batches = []
+
+        # Contact point arrays, (c,) or (c, 2).
+        self.indexA = None
+        self.indexB = None
+        self.anchorsA = None
+        self.anchorsB = None
+        self.normals = None
+        self.tangents = None
+        self.biases = None
+        self.frictions = None
+        self.normal_impulses = None
+        self.tangent_impulses = None
+
+    #====================
+    # Public Methods
+    def solve(self, batches, iterations, velocity_tolerance):
+        """
+        Solve the contacts. They must be initialized, the warm
+        starting impulses already applied.
+        @param { Manifold[][] } batches : contacts to solve, in
+        batches solved one after the other. e.g. '[contacts]' or
+        the colours from 'ContactColoring.color'.
+        @param { int } iterations : most iterations to run.
+        @param { float } velocity_tolerance : stop once an iteration
+        change no contact velocity more than this.
+        @return { int } : iterations ran.
+        """
+
+        if not any(batches):
+            return 0
+
+        self.pack(batches)
+
+        batch_masses = [self.compute_masses(batch) for batch in self.point_batches]
+
+        iterations_used = 0
+        for index in range(0, iterations):
+            max_change = 0.0
+            for batch, masses in zip(self.point_batches, batch_masses):
+                max_change = max(max_change,
+                                 self.solve_batch(batch, masses[0], masses[1]))
+
+            iterations_used += 1
+            if max_change < velocity_tolerance:
+                break
+
+        self.unpack()
+
+        return iterations_used
+
+    def pack(self, batches):
+        """
+        Copy the bodies and contact points into the arrays. The
+        points of a batch are split by point index, two points of
+        one manifold always share both bodies.
+        @param { Manifold[][] } batches : initialized contacts.
+        """
+
+        body_indices = {}
+        bodies = []
+
+        indexA = []
+        indexB = []
+        points = []
+        normals = []
+        biases = []
+        frictions = []
+        normal_impulses = []
+        tangent_impulses = []
+
+        self.point_manifolds = []
+        self.point_indices = []
+        self.point_batches = []
+
+        for contacts in batches:
+            # contact points of the batch, by point index
+            batch_points = ([], [])
+
+            for manifold in contacts:
+                bodyA = manifold.bodyA
+                bodyB = manifold.bodyB
+
+                index = body_indices.get(bodyA)
+                if index is None:
+                    index = len(bodies)
+                    body_indices[bodyA] = index
+                    bodies.append(bodyA)
+                bodyA_index = index
+
+                index = body_indices.get(bodyB)
+                if index is None:
+                    index = len(bodies)
+                    body_indices[bodyB] = index
+                    bodies.append(bodyB)
+                bodyB_index = index
+
+                normal = (manifold.normal.x, manifold.normal.y)
+
+                for point in range(0, manifold.contact_count):
+                    contact = manifold.contacts[point]
+
+                    batch_points[point].append(len(indexA))
+
+                    indexA.append(bodyA_index)
+                    indexB.append(bodyB_index)
+                    points.append((contact.x, contact.y))
+                    normals.append(normal)
+                    biases.append(manifold.velocity_biases[point])
+                    frictions.append(manifold.mixed_dynamic_friction)
+                    normal_impulses.append(manifold.normal_impulses[point])
+                    tangent_impulses.append(manifold.tangent_impulses[point])
+
+                    self.point_manifolds.append(manifold)
+                    self.point_indices.append(point)
+
+            for batch in batch_points:
+                if batch:
+                    self.point_batches.append(numpy.array(batch))
+
+        self.bodies = bodies
+        self.velocities = numpy.array(
+            [(body.velocity.x, body.velocity.y) for body in bodies], dtype = float)
+        self.angular_velocities = numpy.array(
+            [body.angular_velocity for body in bodies], dtype = float)
+        self.inverse_masses = numpy.array(
+            [body.inverse_mass for body in bodies], dtype = float)
+        self.inverse_inertias = numpy.array(
+            [body.inverse_inertia for body in bodies], dtype = float)
+        positions = numpy.array(
+            [(body.position.x, body.position.y) for body in bodies], dtype = float)
+
+        self.indexA = numpy.array(indexA)
+        self.indexB = numpy.array(indexB)
+
+        # Radii from COM to contact
+        points = numpy.array(points, dtype = float)
+        self.anchorsA = points - positions[self.indexA]
+        self.anchorsB = points - positions[self.indexB]
+
+        self.normals = numpy.array(normals, dtype = float)
+        self.tangents = numpy.empty_like(self.normals)
+        self.tangents[:, 0] = self.normals[:, 1]
+        self.tangents[:, 1] = -self.normals[:, 0]
+
+        self.biases = numpy.array(biases, dtype = float)
+        self.frictions = numpy.array(frictions, dtype = float)
+        self.normal_impulses = numpy.array(normal_impulses, dtype = float)
+        self.tangent_impulses = numpy.array(tangent_impulses, dtype = float)
+
+    def unpack(self):
+        """Write the velocities and accumulated impulses back."""
+
+        for body, velocity, angular_velocity in zip(
+                self.bodies, self.velocities.tolist(),
+                self.angular_velocities.tolist()):
+            body.velocity.set_xy(velocity[0], velocity[1])
+            body.angular_velocity = angular_velocity
+
+        for manifold, point, normal_impulse, tangent_impulse in zip(
+                self.point_manifolds, self.point_indices,
+                self.normal_impulses.tolist(), self.tangent_impulses.tolist()):
+            manifold.normal_impulses[point] = normal_impulse
+            manifold.tangent_impulses[point] = tangent_impulse
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    def compute_masses(self, batch):
+        """
+        Effective mass along the normal and the tangent of the
+        contact points of a batch, with the bodies' mass split
+        between the points of the batch touching them.
+        @param { numpy.ndarray } batch : contact point indices.
+        @return { tuple } : (normal masses, tangent masses).
+        """
+
+        indexA = self.indexA[batch]
+        indexB = self.indexB[batch]
+
+        # How many points of the batch touch each body
+        body_count = len(self.bodies)
+        splits = (numpy.bincount(indexA, minlength = body_count) +
+                  numpy.bincount(indexB, minlength = body_count))
+
+        inverse_massA = self.inverse_masses[indexA] * splits[indexA]
+        inverse_massB = self.inverse_masses[indexB] * splits[indexB]
+        inverse_inertiaA = self.inverse_inertias[indexA] * splits[indexA]
+        inverse_inertiaB = self.inverse_inertias[indexB] * splits[indexB]
+
+        return (self.effective_masses(batch, self.normals[batch],
+                                      inverse_massA, inverse_massB,
+                                      inverse_inertiaA, inverse_inertiaB),
+                self.effective_masses(batch, self.tangents[batch],
+                                      inverse_massA, inverse_massB,
+                                      inverse_inertiaA, inverse_inertiaB))
+
+    def effective_masses(self, batch, directions,
+                         inverse_massA, inverse_massB,
+                         inverse_inertiaA, inverse_inertiaB):
+        """One over the inverse mass sum along the directions."""
+
+        anchorsA = self.anchorsA[batch]
+        anchorsB = self.anchorsB[batch]
+
+        ra_cross = anchorsA[:, 0] * directions[:, 1] - anchorsA[:, 1] * directions[:, 0]
+        rb_cross = anchorsB[:, 0] * directions[:, 1] - anchorsB[:, 1] * directions[:, 0]
+
+        inv_mass_sum = (inverse_massA + inverse_massB +
+                        ra_cross * ra_cross * inverse_inertiaA +
+                        rb_cross * rb_cross * inverse_inertiaB)
+
+        # two static bodies, nothing to solve.
+        return numpy.where(inv_mass_sum > 0.0,
+                           1.0 / numpy.where(inv_mass_sum > 0.0, inv_mass_sum, 1.0),
+                           0.0)
+
+    def solve_batch(self, batch, normal_masses, tangent_masses):
+        """
+        Solve the normal then the friction impulse of every point
+        of the batch at once.
+        @return { float } : largest change of contact velocity.
+        """
+
+        # Calculate impulse scalar, clamp the accumulated impulse,
+        # contact can only push
+        contact_vel = self.relative_velocity(batch, self.normals[batch])
+        j = normal_masses * (self.biases[batch] - contact_vel)
+
+        old_impulses = self.normal_impulses[batch]
+        new_impulses = numpy.maximum(old_impulses + j, 0.0)
+        self.normal_impulses[batch] = new_impulses
+        j = new_impulses - old_impulses
+
+        self.apply_impulses(batch, self.normals[batch], j)
+
+        # Friction impulse, Coulumb's law clamp the accumulated
+        # friction to the friction cone.
+        tangent_vel = self.relative_velocity(batch, self.tangents[batch])
+        jt = -tangent_masses * tangent_vel
+
+        max_friction = self.frictions[batch] * new_impulses
+        old_impulses = self.tangent_impulses[batch]
+        new_tangent = numpy.clip(old_impulses + jt, -max_friction, max_friction)
+        self.tangent_impulses[batch] = new_tangent
+        jt = new_tangent - old_impulses
+
+        self.apply_impulses(batch, self.tangents[batch], jt)
+
+        # Velocity change made, impulse over effective mass
+        change = numpy.maximum(
+            numpy.abs(j) / numpy.where(normal_masses > 0.0, normal_masses, 1.0),
+            numpy.abs(jt) / numpy.where(tangent_masses > 0.0, tangent_masses, 1.0))
+
+        return change.max()
+
+    def relative_velocity(self, batch, directions):
+        """Relative velocity of B to A at each point along the directions."""
+
+        indexA = self.indexA[batch]
+        indexB = self.indexB[batch]
+        anchorsA = self.anchorsA[batch]
+        anchorsB = self.anchorsB[batch]
+
+        velocityA = self.velocities[indexA]
+        velocityB = self.velocities[indexB]
+        angularA = self.angular_velocities[indexA]
+        angularB = self.angular_velocities[indexB]
+
+        # v + w x r
+        rv_x = (velocityB[:, 0] - angularB * anchorsB[:, 1] -
+                velocityA[:, 0] + angularA * anchorsA[:, 1])
+        rv_y = (velocityB[:, 1] + angularB * anchorsB[:, 0] -
+                velocityA[:, 1] - angularA * anchorsA[:, 0])
+
+        return rv_x * directions[:, 0] + rv_y * directions[:, 1]
+
+    def apply_impulses(self, batch, directions, magnitudes):
+        """Apply -impulse on body A and impulse on body B of each point."""
+
+        indexA = self.indexA[batch]
+        indexB = self.indexB[batch]
+        anchorsA = self.anchorsA[batch]
+        anchorsB = self.anchorsB[batch]
+
+        impulses = directions * magnitudes[:, None]
+
+        body_count = len(self.bodies)
+        inverse_masses = self.inverse_masses
+        inverse_inertias = self.inverse_inertias
+
+        # r x impulse
+        torqueA = anchorsA[:, 0] * impulses[:, 1] - anchorsA[:, 1] * impulses[:, 0]
+        torqueB = anchorsB[:, 0] * impulses[:, 1] - anchorsB[:, 1] * impulses[:, 0]
+
+        for axis in range(0, 2):
+            self.velocities[:, axis] += inverse_masses * (
+                numpy.bincount(indexB, impulses[:, axis], body_count) -
+                numpy.bincount(indexA, impulses[:, axis], body_count))
+
+        self.angular_velocities += inverse_inertias * (
+            numpy.bincount(indexB, torqueB, body_count) -
+            numpy.bincount(indexA, torqueA, body_count))
+
+    #====================
+    # setter / getter
@@ -14,3 +14,21 @@ class ShapeType(object):
     @note Remember to install 'aenum' and 'enum34' from pip.
     """
     NONE, CIRCLE, POLYGON = range(3)
+
+    # number of shape types, next registered type get this value.
+    COUNT = 3
+
+    @staticmethod
+    def register(name):
+        """
+        Add a new shape type.
+        @param { str } name : name of the type, e.g. 'CAPSULE'.
+        @return { int } : value of the new type.
+        """
+        if hasattr(ShapeType, name):
+            return getattr(ShapeType, name)
+
+        value = ShapeType.COUNT
+        setattr(ShapeType, name, value)
+        ShapeType.COUNT += 1
+        return value
@@ -7,19 +7,21 @@
 #                    Copyright (c) 2017 by Shen, Jen-Chieh $
 #  ========================================================================
 
+from jcspygm.core.JCSPyGm_GameObject import JCSPyGm_GameObject
 from jcspygm.core.JCSPyGm_Interface import JCSPyGm_Interface
 from jcspygm.core.JCSPyGm_Scene import JCSPyGm_Scene
 from jcspygm.managers.JCSPyGm_SceneManager import JCSPyGm_SceneManager
 from jcspygm.util.JCSPyGm_Input import JCSPyGm_Input
 
-from jcspygm_physics.physics import Physics
+from jcspygm_physics.world import World
 from jcspygm_physics.vector2  import Vector2
+from jcspygm_physics.enum.shape_type import ShapeType
 
 from jcspygm_physics.shapes.circle import Circle
 from jcspygm_physics.shapes.polygon import Polygon
-from jcspygm_physics.manifold import Manifold
 
 import jcs_math
+import math
 import time
 import pygame
 import random
@@ -62,7 +64,9 @@ class Game(object):
         # system specific
         self.gamePause = False
 
-        self.iterations = 10
+        # the simulation, 'update' feed it the frame time and it
+        # step with its own fixed time step.
+        self.world = World()
 
         self.initialize()
 
@@ -90,7 +94,7 @@ class Game(object):
         # update scene manager
         self.sceneManager.update(deltaTime)
 
-        self.step(deltaTime)
+        self.world.step(deltaTime)
 
     def draw(self, windowInfo):
         """Main render layer graphics
@@ -187,11 +191,6 @@ class Game(object):
 
         # --------------------------------------------------
 
-        # manifold list.
-        self.contacts = []
-        # store all the shape in current scene.
-        self.shapes = []
-
         tmpShape = Circle(200, 200, 30)
         tmpShape.get_rigidbody().set_static()
         self.add_shape_to_scene(tmpShape)
@@ -207,67 +206,15 @@ class Game(object):
         """
         Wrap the complex operation into one function.
         @param { Shape } shape : new shape going to be add
-        to the scene.
+        to the scene. Call 'set_static' on its rigidbody before
+        adding it if it is static.
         @return { Shape } : shape have been initialized
         """
 
-        self.shapes.append(shape)
+        self.world.add_shape(shape)
 
         # add it to the scene
-        self.gameInterface.add_game_object(shape)
-
-    def step(self, deltaTime):
-        """Step collision check."""
-
-        # Generate new collision info
-
-        # clear all contacs every frame.
-        del self.contacts[:]
-
-        for indexA in range(0, len(self.shapes)):
-
-            tmpShapeA = self.shapes[indexA]
-            tmpBodyA = tmpShapeA.get_rigidbody()
-
-            for indexB in range(indexA + 1, len(self.shapes)):
-                tmpShapeB = self.shapes[indexB]
-                tmpBodyB = tmpShapeB.get_rigidbody()
-
-                if (tmpBodyA.get_inverse_mass() == 0 and
-                    tmpBodyB.get_inverse_mass() == 0):
-                    continue
-
-                tmpManifold = Manifold(tmpShapeA, tmpShapeB)
-                tmpManifold.solve()
-                if tmpManifold.contact_count > 0:
-                    self.contacts.append(tmpManifold)
-
-        # Integrate forces
-        for index in range(0, len(self.shapes)):
-            Physics.integrate_forces(self.shapes[index], deltaTime)
-
-        # Initialize collision
-        for index in range(0, len(self.contacts)):
-            self.contacts[index].initialize(deltaTime)
-
-        # Solve Collisions
-        for index in range(0, self.iterations):
-            for index2 in range(0, len(self.contacts)):
-                self.contacts[index2].apply_impulse()
-
-        # Integrate velocities
-        for index in range(0, len(self.shapes)):
-            Physics.integrate_velocity(self.shapes[index], deltaTime)
-
-        # Corret positions
-        for index in range(0, len(self.contacts)):
-            self.contacts[index].positional_correction()
-
-        # Clear all forces
-        for index in range(0, len(self.shapes)):
-            tmpBody = self.shapes[index].get_rigidbody()
-            tmpBody.get_force().set_xy(0, 0)
-            tmpBody.torque = 0
+        self.gameInterface.add_game_object(ShapeRenderer(shape))
 
     def render_contacts(self, windowInfo):
         """Render All Contacts and Normal in order to see how
@@ -277,8 +224,9 @@ class Game(object):
         # draw contact point
         contact_point_color = (255, 0, 0)
         point_radius = 2
-        for index in range(0, len(self.contacts)):
-            tmpManifold = self.contacts[index]
+        contacts = self.world.contacts
+        for index in range(0, len(contacts)):
+            tmpManifold = contacts[index]
             for index2 in range(0, tmpManifold.contact_count):
                 c = tmpManifold.contacts[index2]
                 pygame.draw.circle(
@@ -290,16 +238,14 @@ class Game(object):
 
         # draw contact normal
         contact_nomral_color = (0, 255, 0)
-        for index in range(0, len(self.contacts)):
-            tmpManifold = self.contacts[index]
+        for index in range(0, len(contacts)):
+            tmpManifold = contacts[index]
             n = tmpManifold.normal
             for index2 in range(0, tmpManifold.contact_count):
 
                 c = tmpManifold.contacts[index2]
                 c_l = Vector2(c.x, c.y)
-
-                n *= 8
-                c_l += n
+                c_l.add_scaled(n, 8)
 
                 line_vertices = []
                 line_vertices.append((c.x, c.y))
@@ -322,3 +268,117 @@ class Game(object):
     # --------------------------------------------
     # setter / getter
     # --------------------------------------------
+    def get_world(self):
+        return self.world
+
+
+class ShapeRenderer(JCSPyGm_GameObject):
+    """
+    @class ShapeRenderer
+    @brief Game object drawing one shape of the world in the scene,
+    so the shapes and the world stay free of pygame and jcspygm.
+    """
+
+    # --------------------------------------------
+    # Public Variables
+    # --------------------------------------------
+
+    # --------------------------------------------
+    # Private Variables
+    # --------------------------------------------
+
+    # --------------------------------------------
+    # Protected Variables
+    # --------------------------------------------
+
+    # --------------------------------------------
+    # Constructor
+    # --------------------------------------------
+    def __init__(self, shape):
+        """
+        Constructor.
+        @param { Shape } shape : shape to draw.
+        """
+
+        super(ShapeRenderer, self).__init__()
+
+        self.shape = shape
+
+    # --------------------------------------------
+    # Public Methods
+    # --------------------------------------------
+    def update(self, deltaTime):
+        """The world move the shape, nothing to update."""
+
+    def draw(self, windowInfo):
+        """Start render."""
+
+        if self.shape.type == ShapeType.CIRCLE:
+            self.draw_circle(windowInfo)
+        elif self.shape.type == ShapeType.POLYGON:
+            self.draw_polygon(windowInfo)
+
+    def draw_circle(self, windowInfo):
+        """Render the circle, with a line from the centre so the
+        orientation is visible."""
+
+        circle = self.shape
+        body = circle.rigidbody
+
+        draw_pos_x = int(body.position.x)
+        draw_pos_y = int(body.position.y)
+
+        pygame.draw.circle(
+            windowInfo,
+            circle.color,
+            (draw_pos_x, draw_pos_y),
+            circle.radius,
+            circle.thickness)
+
+        c = math.cos(body.orientation)
+        s = math.sin(body.orientation)
+        r = Vector2(-s, c)
+        r *= circle.radius
+        r += body.position
+
+        line_vertices = []
+        line_vertices.append((draw_pos_x, draw_pos_y))
+        line_vertices.append((r.x, r.y))
+
+        pygame.draw.lines(
+            windowInfo,
+            circle.color,
+            False,
+            line_vertices)
+
+    def draw_polygon(self, windowInfo):
+        """Render the polygon with its world space vertices."""
+
+        poly = self.shape
+
+        draw_vertices = []
+        world_vertices = poly.get_world_vertices()
+
+        for index in range(0, poly.vertex_count):
+            tmpVec = world_vertices[index]
+            draw_vertices.append((tmpVec.x, tmpVec.y))
+
+        pygame.draw.polygon(
+            windowInfo,
+            poly.color,
+            draw_vertices,
+            poly.thickness)
+
+    # --------------------------------------------
+    # Protected Methods
+    # --------------------------------------------
+
+    # --------------------------------------------
+    # Private Methods
+    # --------------------------------------------
+
+    # --------------------------------------------
+    # setter / getter
+    # --------------------------------------------
+    def get_shape(self):
+        return self.shape
@@ -0,0 +1,231 @@
+# ========================================================================
+# $File: gjk.py $
+# $Date: 2026-10-18 16:42:08 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.vector2 import Vector2
+
+import jcspygm_physics.jcs_math
+import math
+
+
+class GJK(object):
+    """
+    @class GJK
+    @brief Gilbert-Johnson-Keerthi intersection test and Expanding
+    Polytope Algorithm for two convex polygons. Both work on the
+    Minkowski difference A - B, which contain the origin when the
+    polygons overlap. Support points come from the polygons' hill
+    climbing support queries.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    MAX_ITERATIONS = 32
+
+    EPA_MAX_ITERATIONS = 32
+    # stop expanding when the polytope grow less than this.
+    EPA_TOLERANCE = 0.0001
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+
+    #====================
+    # Public Methods
+    @staticmethod
+    def support(polyA, polyB, dx, dy):
+        """
+        Extreme point of the Minkowski difference A - B along a direction.
+        @param { Polygon } polyA : polygon A.
+        @param { Polygon } polyB : polygon B.
+        @param { float } dx : direction on x-axis.
+        @param { float } dy : direction on y-axis.
+        @return { Vector2 } : support point.
+        """
+        va = polyA.get_world_vertices()[polyA.get_world_support_index(dx, dy)]
+        vb = polyB.get_world_vertices()[polyB.get_world_support_index(-dx, -dy)]
+        return Vector2(va.x - vb.x, va.y - vb.y)
+
+    @staticmethod
+    def intersect(polyA, polyB, simplex):
+        """
+        Check if two convex polygons overlap.
+        @param { Polygon } polyA : polygon A.
+        @param { Polygon } polyB : polygon B.
+        @param { Vector2[] } simplex : empty list, hold a triangle
+        that contain the origin when overlapping.
+        @return { bool } : True if the polygons overlap.
+        """
+
+        # Start toward B from A, the difference is the other way.
+        posA = polyA.get_rigidbody().position
+        posB = polyB.get_rigidbody().position
+        dx = posA.x - posB.x
+        dy = posA.y - posB.y
+        if dx == 0.0 and dy == 0.0:
+            dx = 1.0
+
+        a = GJK.support(polyA, polyB, dx, dy)
+        simplex.append(a)
+        dx = -a.x
+        dy = -a.y
+
+        for count in range(0, GJK.MAX_ITERATIONS):
+            if dx == 0.0 and dy == 0.0:
+                # origin on the boundary, only touching.
+                return False
+
+            a = GJK.support(polyA, polyB, dx, dy)
+            if a.x * dx + a.y * dy <= 0.0:
+                # could not pass the origin, separated.
+                return False
+
+            simplex.append(a)
+
+            if len(simplex) == 2:
+                dx, dy = GJK.line_direction(simplex[0], simplex[1])
+                continue
+
+            found, dx, dy = GJK.triangle_direction(simplex)
+            if found:
+                return True
+
+        return False
+
+    @staticmethod
+    def penetration_normal(polyA, polyB, simplex):
+        """
+        Expand the simplex until the face of the Minkowski
+        difference closest to the origin is found.
+        @param { Polygon } polyA : polygon A.
+        @param { Polygon } polyB : polygon B.
+        @param { Vector2[] } simplex : triangle from 'intersect',
+        expanded in place.
+        @return { Vector2 } : normal from A to B.
+        """
+
+        polytope = simplex
+
+        # Keep the polytope counter clockwise so edge normals
+        # (e.y, -e.x) point outward.
+        a, b, c = polytope[0], polytope[1], polytope[2]
+        if (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x) < 0.0:
+            polytope[1], polytope[2] = c, b
+
+        normal = Vector2()
+
+        for iteration in range(0, GJK.EPA_MAX_ITERATIONS):
+            # Find the edge closest to the origin
+            best_distance = jcspygm_physics.jcs_math.FLT_MAX
+            best_index = 0
+            count = len(polytope)
+
+            for index in range(0, count):
+                p1 = polytope[index]
+                if index + 1 == count:
+                    p2 = polytope[0]
+                else:
+                    p2 = polytope[index + 1]
+
+                nx = p2.y - p1.y
+                ny = p1.x - p2.x
+                length = math.sqrt(nx * nx + ny * ny)
+                if length == 0.0:
+                    continue
+                nx /= length
+                ny /= length
+
+                distance = nx * p1.x + ny * p1.y
+                if distance < best_distance:
+                    best_distance = distance
+                    best_index = index
+                    normal.set_xy(nx, ny)
+
+            # Push the closest edge out, done when it can not move.
+            s = GJK.support(polyA, polyB, normal.x, normal.y)
+            if (s.x * normal.x + s.y * normal.y) - best_distance < GJK.EPA_TOLERANCE:
+                break
+
+            polytope.insert(best_index + 1, s)
+
+        return normal
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    @staticmethod
+    def line_direction(b, a):
+        """
+        Direction from segment 'b'-'a' toward the origin.
+        @return { (float, float) } : direction.
+        """
+
+        abx = b.x - a.x
+        aby = b.y - a.y
+
+        # Perpendicular of the segment on the origin side
+        dx = -aby
+        dy = abx
+        if dx * -a.x + dy * -a.y < 0.0:
+            dx = -dx
+            dy = -dy
+
+        return dx, dy
+
+    @staticmethod
+    def triangle_direction(simplex):
+        """
+        Check if the triangle contain the origin, if not drop the
+        vertex away from the origin.
+        @param { Vector2[] } simplex : three points, newest last.
+        @return { (bool, float, float) } : contain the origin, and
+        the next search direction.
+        """
+
+        c, b, a = simplex[0], simplex[1], simplex[2]
+
+        abx = b.x - a.x
+        aby = b.y - a.y
+        acx = c.x - a.x
+        acy = c.y - a.y
+
+        # Perpendicular of ab away from c
+        px = -aby
+        py = abx
+        if px * acx + py * acy > 0.0:
+            px = -px
+            py = -py
+        if px * -a.x + py * -a.y > 0.0:
+            del simplex[0]
+            return False, px, py
+
+        # Perpendicular of ac away from b
+        px = -acy
+        py = acx
+        if px * abx + py * aby > 0.0:
+            px = -px
+            py = -py
+        if px * -a.x + py * -a.y > 0.0:
+            del simplex[1]
+            return False, px, py
+
+        return True, 0.0, 0.0
+
+    #====================
+    # setter / getter
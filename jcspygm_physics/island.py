@@ -0,0 +1,172 @@
+# ========================================================================
+# $File: island.py $
+# $Date: 2026-10-18 19:04:17 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+
+class Island(object):
+    """
+    @class Island
+    @brief Group of dynamic shapes linked by contacts, and those
+    contacts. Islands do not affect each other during a step so
+    each one can be solved on its own.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        # { Shape[] } : dynamic shapes of this island.
+        self.shapes = []
+
+        # { Manifold[] } : contacts between the shapes, or with
+        # static shapes.
+        self.contacts = []
+
+    #====================
+    # Public Methods
+    @staticmethod
+    def build(shapes, contacts):
+        """
+        Group the dynamic shapes into islands with union-find over
+        the contacts. Static shapes belong to no island, so they
+        never link two islands together.
+        @param { Shape[] } shapes : all shapes in the scene.
+        @param { Manifold[] } contacts : contacts of this step.
+        @return { Island[] } : islands, every dynamic shape is in
+        exactly one of them.
+        """
+
+        # Give each dynamic body an index, static get -1.
+        dynamic_shapes = []
+        for shape in shapes:
+            body = shape.rigidbody
+            if body.inverse_mass == 0.0:
+                body.island_index = -1
+            else:
+                body.island_index = len(dynamic_shapes)
+                dynamic_shapes.append(shape)
+
+        parent = list(range(0, len(dynamic_shapes)))
+
+        # Union the two bodies of every contact
+        for contact in contacts:
+            indexA = contact.bodyA.island_index
+            indexB = contact.bodyB.island_index
+            if indexA < 0 or indexB < 0:
+                continue
+
+            rootA = Island.find_root(parent, indexA)
+            rootB = Island.find_root(parent, indexB)
+            if rootA != rootB:
+                parent[rootB] = rootA
+
+        # One island per root
+        islands = []
+        island_of_root = {}
+        for index in range(0, len(dynamic_shapes)):
+            root = Island.find_root(parent, index)
+
+            island = island_of_root.get(root)
+            if island is None:
+                island = Island()
+                island_of_root[root] = island
+                islands.append(island)
+
+            island.shapes.append(dynamic_shapes[index])
+
+        # Contacts go with their dynamic body
+        for contact in contacts:
+            index = contact.bodyA.island_index
+            if index < 0:
+                index = contact.bodyB.island_index
+            if index < 0:
+                continue
+
+            island_of_root[Island.find_root(parent, index)].contacts.append(contact)
+
+        return islands
+
+    def is_sleeping(self):
+        """ @return { bool } : True if every shape is sleeping. """
+        for shape in self.shapes:
+            if not shape.rigidbody.is_sleeping:
+                return False
+        return True
+
+    def wake(self):
+        """Wake every shape, something awake is touching the island."""
+        for shape in self.shapes:
+            body = shape.rigidbody
+            if body.is_sleeping:
+                body.wake()
+
+    def update_sleep(self, deltaTime, linear_tolerance, angular_tolerance, time_to_sleep):
+        """
+        Count how long each body has been slow, put the whole
+        island to sleep once all of them have been slow long enough.
+        @param { float } deltaTime : time step.
+        @param { float } linear_tolerance : max speed to sleep.
+        @param { float } angular_tolerance : max angular speed to sleep.
+        @param { float } time_to_sleep : time to be slow before sleep.
+        @return { bool } : True if the island went to sleep.
+        """
+
+        linear_tolerance_sqr = linear_tolerance * linear_tolerance
+        min_sleep_time = time_to_sleep
+
+        for shape in self.shapes:
+            body = shape.rigidbody
+            if (body.velocity.len_sqr() > linear_tolerance_sqr or
+                abs(body.angular_velocity) > angular_tolerance):
+                body.sleep_time = 0.0
+            else:
+                body.sleep_time += deltaTime
+
+            min_sleep_time = min(min_sleep_time, body.sleep_time)
+
+        if min_sleep_time < time_to_sleep:
+            return False
+
+        for shape in self.shapes:
+            shape.rigidbody.sleep()
+        return True
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    @staticmethod
+    def find_root(parent, index):
+        """Find the root of the set, halving the path on the way."""
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    #====================
+    # setter / getter
+    def get_shape_count(self):
+        return len(self.shapes)
+
+    def get_contact_count(self):
+        return len(self.contacts)
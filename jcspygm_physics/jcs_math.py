@@ -7,7 +7,6 @@
 #                    Copyright (c) 2017 by Shen, Jen-Chieh $
 #  ========================================================================
 
-from jcspygm.util.JCSPyGm_Debug import JCSPyGm_Debug
 import math
 
 import physics
@@ -59,9 +58,9 @@ def pythagorean_theorem(side1, side2, targetSide):
         # hypotenuse just simple addition.
         result = math.sqrt(sqr(side1) + sqr(side2))
     else:
-        JCSPyGm_Debug.Error(
+        raise ValueError(
             "Type enter does not exist. "
-            + "Please enter either opp/adj/hyp.");
+            + "Please enter either opp/adj/hyp.")
 
     return result
 
@@ -72,7 +71,7 @@ def dot_product(vec1, vec2):
     @return { float } : dot product result.
     """
 
-    return vec1.get_x() * vec2.get_x() + vec1.get_y() * vec2.get_y()
+    return vec1.x * vec2.x + vec1.y * vec2.y
 
 def cross_product(vec1, vec2):
     """
@@ -82,7 +81,7 @@ def cross_product(vec1, vec2):
     @return { float } : Return the scalar.
     """
 
-    return vec1.get_x() * vec2.get_y() - vec1.get_y() * vec2.get_x()
+    return vec1.x * vec2.y - vec1.y * vec2.x
 
 def cross_product_fv(val, vec):
     """
@@ -92,7 +91,7 @@ def cross_product_fv(val, vec):
     @return { Vector2 } : return cross product result.
     """
 
-    return vector2.Vector2(-val * vec.get_y(), val * vec.get_x())
+    return vector2.Vector2(-val * vec.y, val * vec.x)
 
 def cross_product_vf(vec, val):
     """
@@ -102,7 +101,7 @@ def cross_product_vf(vec, val):
     @return { Vector2 } : return cross product result.
     """
 
-    return vector2.Vector2(val * vec.get_y(), -val * vec.get_x())
+    return vector2.Vector2(val * vec.y, -val * vec.x)
 
 def sqr(val):
     """Square the value.
@@ -7,16 +7,18 @@
 #                   Copyright (c) 2017 by Shen, Jen-Chieh $
 # ========================================================================
 
-from jcspygm.util.JCSPyGm_Debug import JCSPyGm_Debug
 from jcspygm_physics.vector2 import Vector2
-from jcspygm_physics.enum.shape_type import ShapeType
 
 from jcspygm_physics.physics import Physics
 from jcspygm_physics.collision import Collision
 
 import jcs_math
+import logging
 import math
 
+logger = logging.getLogger(__name__)
+
+
 class Manifold(object):
     """
     @class Manifold
@@ -27,6 +29,16 @@ class Manifold(object):
     #*********************************************#
     #*             Public Variables              *#
     #*********************************************#
+    __slots__ = ('shapeA', 'shapeB', 'bodyA', 'bodyB',
+                 'penetration', 'normal', 'contacts', 'contact_count',
+                 'feature_ids', 'normal_impulses', 'tangent_impulses',
+                 'old_contact_count', 'old_feature_ids',
+                 'old_normal_impulses', 'old_tangent_impulses',
+                 'velocity_biases', 'tangent', 'anchorsA', 'anchorsB',
+                 'normal_masses', 'tangent_masses',
+                 'mixed_restitution', 'mixed_dynamic_friction',
+                 'pair_stamp',
+                 'separating_shape', 'separating_face')
 
     #*********************************************#
     #              Private Variables             *#
@@ -63,161 +75,333 @@ class Manifold(object):
         # Number of contacts that occured during collision
         self.contact_count = 0
 
+        # Feature of each contact, set by 'Collision'. Same feature
+        # next step means same contact.
+        self.feature_ids = [0, 0]
+
+        # Impulses accumulated on each contact during the step,
+        # carried to the matching contacts next step (warm starting).
+        self.normal_impulses = [0.0, 0.0]
+        self.tangent_impulses = [0.0, 0.0]
+
+        # Contacts of last step, to match against.
+        self.old_contact_count = 0
+        self.old_feature_ids = [0, 0]
+        self.old_normal_impulses = [0.0, 0.0]
+        self.old_tangent_impulses = [0.0, 0.0]
+
+        # Restitution target velocity of each contact.
+        self.velocity_biases = [0.0, 0.0]
+
+        # Constants of each contact for the step, computed once by
+        # 'initialize' and reuse by every solver pass. Radii from
+        # each body COM to the contact, and one over the inverse
+        # mass sum along the normal and the tangent.
+        self.tangent = Vector2()
+        self.anchorsA = [Vector2(), Vector2()]
+        self.anchorsB = [Vector2(), Vector2()]
+        self.normal_masses = [0.0, 0.0]
+        self.tangent_masses = [0.0, 0.0]
+
         self.mixed_restitution = 0
         self.mixed_dynamic_friction = 0
-        self.mixed_static_friction = 0
+
+        # last step the pair cache look up this manifold.
+        self.pair_stamp = 0
+
+        # Last axis found separating a polygon pair, tested first
+        # next step. Shape is SEPARATING_NONE, SEPARATING_SHAPE_A
+        # or SEPARATING_SHAPE_B, face index on that shape.
+        self.separating_shape = Collision.SEPARATING_NONE
+        self.separating_face = 0
 
     #====================
     # Public Methods
-    def initialize(self, deltaTime):
+    def reset(self):
+        """Clear the collision result so this manifold can be
+        solve again next step. Contacts of this step are kept as
+        the old contacts for warm starting."""
+        self.old_contact_count = self.contact_count
+        self.old_feature_ids, self.feature_ids = self.feature_ids, self.old_feature_ids
+        self.old_normal_impulses, self.normal_impulses = self.normal_impulses, self.old_normal_impulses
+        self.old_tangent_impulses, self.tangent_impulses = self.tangent_impulses, self.old_tangent_impulses
+
+        self.penetration = 0
+        self.contact_count = 0
+
+    def match_contacts(self):
+        """Start each contact with the impulses of the contact of
+        last step that have the same feature."""
+
+        for index in range(0, self.contact_count):
+            normal_impulse = 0.0
+            tangent_impulse = 0.0
+
+            feature_id = self.feature_ids[index]
+            for index2 in range(0, self.old_contact_count):
+                if self.old_feature_ids[index2] == feature_id:
+                    normal_impulse = self.old_normal_impulses[index2]
+                    tangent_impulse = self.old_tangent_impulses[index2]
+                    break
+
+            self.normal_impulses[index] = normal_impulse
+            self.tangent_impulses[index] = tangent_impulse
+
+    def warm_start(self):
+        """Apply the impulses carried from last step up front."""
+
+        pool = Collision.scratch_pool
+        mark = pool.mark()
+        impulse = pool.borrow()
+
+        for index in range(0, self.contact_count):
+            normal_impulse = self.normal_impulses[index]
+            tangent_impulse = self.tangent_impulses[index]
+            impulse.set_xy(
+                self.normal.x * normal_impulse + self.tangent.x * tangent_impulse,
+                self.normal.y * normal_impulse + self.tangent.y * tangent_impulse)
+            self.bodyB.apply_impulse(impulse, self.anchorsB[index])
+            impulse *= -1.0
+            self.bodyA.apply_impulse(impulse, self.anchorsA[index])
+
+        pool.release(mark)
+
+    def initialize(self, deltaTime, resting_speed_sqr = None):
+        """
+        Compute the constants of each contact for the step and warm
+        start them.
+        @param { float } deltaTime : time step.
+        @param { float } resting_speed_sqr : contact slower than
+        this squared speed do not bounce, the speed gravity give in
+        one step. Pass it to not compute it for each manifold.
+        """
+
+        if resting_speed_sqr is None:
+            resting_speed_sqr = Manifold.resting_speed_sqr(deltaTime)
+
+        bodyA = self.bodyA
+        bodyB = self.bodyB
+        inverse_massA = bodyA.inverse_mass
+        inverse_massB = bodyB.inverse_mass
+        inverse_inertiaA = bodyA.inverse_inertia
+        inverse_inertiaB = bodyB.inverse_inertia
+
+        nx = self.normal.x
+        ny = self.normal.y
+        self.tangent.set_xy(ny, -nx)
+
         # Calculate average restitution
         self.mixed_restitution = min(
-            self.bodyA.get_restitution(),
-            self.bodyB.get_restitution())
+            self.bodyA.restitution,
+            self.bodyB.restitution)
 
-        # Calculate static and dynamic friction
-        self.mixed_static_friction = math.sqrt(
-            self.bodyA.get_static_friction() *
-            self.bodyA.get_static_friction())
+        # Calculate dynamic friction, the accumulated friction
+        # impulse is clamped by it alone.
         self.mixed_dynamic_friction = math.sqrt(
-            self.bodyA.get_dynamic_friction() *
-            self.bodyA.get_dynamic_friction())
+            self.bodyA.dynamic_friction *
+            self.bodyB.dynamic_friction)
 
         for index in range(0, self.contact_count):
             # Calculate radii from COM to contact
-            ra = self.contacts[index] - self.bodyA.get_position()
-            rb = self.contacts[index] - self.bodyB.get_position()
-
-            rv = (self.bodyB.get_velocity() + jcs_math.cross_product_fv(self.bodyB.get_angular_velocity(), rb) -
-                  self.bodyA.get_velocity() - jcs_math.cross_product_fv(self.bodyA.get_angular_velocity(), ra))
+            contact = self.contacts[index]
+            ra = self.anchorsA[index]
+            rb = self.anchorsB[index]
+            ra.set_xy(contact.x - bodyA.position.x, contact.y - bodyA.position.y)
+            rb.set_xy(contact.x - bodyB.position.x, contact.y - bodyB.position.y)
+
+            # Effective mass along the normal and the tangent
+            ra_cross_n = ra.x * ny - ra.y * nx
+            rb_cross_n = rb.x * ny - rb.y * nx
+            inv_mass_sum = (inverse_massA + inverse_massB +
+                            (ra_cross_n * ra_cross_n) * inverse_inertiaA +
+                            (rb_cross_n * rb_cross_n) * inverse_inertiaB)
+            self.normal_masses[index] = 1.0 / inv_mass_sum if inv_mass_sum > 0.0 else 0.0
+
+            ra_cross_t = -ra.x * nx - ra.y * ny
+            rb_cross_t = -rb.x * nx - rb.y * ny
+            inv_mass_sum = (inverse_massA + inverse_massB +
+                            (ra_cross_t * ra_cross_t) * inverse_inertiaA +
+                            (rb_cross_t * rb_cross_t) * inverse_inertiaB)
+            self.tangent_masses[index] = 1.0 / inv_mass_sum if inv_mass_sum > 0.0 else 0.0
+
+            # Relative velocity, v + w x r
+            wa = bodyA.angular_velocity
+            wb = bodyB.angular_velocity
+            rv_x = bodyB.velocity.x - wb * rb.y - bodyA.velocity.x + wa * ra.y
+            rv_y = bodyB.velocity.y + wb * rb.x - bodyA.velocity.y - wa * ra.x
+
+            # keep the approaching velocity to compute the bias.
+            self.velocity_biases[index] = rv_x * nx + rv_y * ny
 
             # Determine if we should perform a resting collision
             # or not. The idea is if the only thing moving this
             # object is gravity, then the collision should be
             # performed without any restitution
-            if rv.len_sqr() < (deltaTime * Physics.GRAVITY).len_sqr() + Physics.EPSILON:
+            if rv_x * rv_x + rv_y * rv_y < resting_speed_sqr:
                 self.mixed_restitution = 0.0
 
+        # Velocity the contacts should bounce away with. Slow
+        # contacts do not bounce, else a settling stack keep
+        # bouncing on and off with the impulses carried over.
+        for index in range(0, self.contact_count):
+            contact_vel = self.velocity_biases[index]
+            if contact_vel < -Physics.RESTITUTION_VELOCITY_THRESHOLD:
+                self.velocity_biases[index] = -self.mixed_restitution * contact_vel
+            else:
+                self.velocity_biases[index] = 0.0
+
+        self.warm_start()
+
     def solve(self):
         """Generate contact information."""
 
-        shapeTypeA = self.shapeA.get_shape_type()
-        shapeTypeB = self.shapeB.get_shape_type()
+        collider = Collision.colliders.get(
+            (self.shapeA.type, self.shapeB.type))
 
         # do nothing if type does not defined.
-        if (shapeTypeA is ShapeType.NONE or
-            shapeTypeB is ShapeType.NONE):
-            JCSPyGm_Debug.Log("Type does not defined when trying to solve...")
+        if collider is None:
+            logger.warning("Type does not defined when trying to solve...")
             return
 
-        if (shapeTypeA is ShapeType.CIRCLE and
-            shapeTypeB is ShapeType.CIRCLE):
-            Collision.circle_to_circle(self, self.shapeA, self.shapeB)
-        elif (shapeTypeA is ShapeType.POLYGON and
-              shapeTypeB is ShapeType.POLYGON):
-            Collision.polygon_to_polygon(self, self.shapeA, self.shapeB)
-        elif (shapeTypeA is ShapeType.CIRCLE and
-              shapeTypeB is ShapeType.POLYGON):
-            Collision.circle_to_polygon(self, self.shapeA, self.shapeB)
-        elif (shapeTypeA is ShapeType.POLYGON and
-              shapeTypeB is ShapeType.CIRCLE):
-            Collision.polygon_to_circle(self, self.shapeA, self.shapeB)
+        # shapes too far apart to touch.
+        if not Collision.bounding_circles_overlap(self.shapeA, self.shapeB):
+            return
+
+        collider(self, self.shapeA, self.shapeB)
+
+        self.match_contacts()
 
     def apply_impulse(self):
-        """Solve impulse and apply to it."""
+        """Solve impulse and apply to it.
+
+        @return { float } : largest change of contact velocity made
+        by the impulses, use to tell when the solver has converged.
+        """
 
-        sum_inverse_mass = self.bodyA.get_inverse_mass() + self.bodyB.get_inverse_mass()
+        sum_inverse_mass = self.bodyA.inverse_mass + self.bodyB.inverse_mass
 
         if jcs_math.safe_equal(sum_inverse_mass, 0.0) is False:
             self.infinite_mass_correction()
-            return
+            return 0.0
+
+        bodyA = self.bodyA
+        bodyB = self.bodyB
+        inverse_massA = bodyA.inverse_mass
+        inverse_massB = bodyB.inverse_mass
+        inverse_inertiaA = bodyA.inverse_inertia
+        inverse_inertiaB = bodyB.inverse_inertia
+
+        # Work on local copies of the velocities, only these two
+        # bodies change, written back once at the end.
+        velocityA = bodyA.velocity
+        velocityB = bodyB.velocity
+        vax = velocityA.x
+        vay = velocityA.y
+        vbx = velocityB.x
+        vby = velocityB.y
+        wa = bodyA.angular_velocity
+        wb = bodyB.angular_velocity
+
+        nx = self.normal.x
+        ny = self.normal.y
+        tx = ny
+        ty = -nx
+
+        max_change = 0.0
 
         for index in range(0, self.contact_count):
-            # Calculate radii from COM to contact
-            ra = self.contacts[index] - self.bodyA.get_position()
-            rb = self.contacts[index] - self.bodyB.get_position()
+            ra = self.anchorsA[index]
+            rb = self.anchorsB[index]
+            rax = ra.x
+            ray = ra.y
+            rbx = rb.x
+            rby = rb.y
 
-            # Relative velocity
-            rv = (self.bodyB.get_velocity() +
-                  jcs_math.cross_product_fv(
-                      self.bodyB.get_angular_velocity(), rb) -
-                  self.bodyA.get_velocity() -
-                  jcs_math.cross_product_fv(
-                      self.bodyA.get_angular_velocity(), ra))
+            # Relative velocity, v + w x r
+            rv_x = vbx - wb * rby - vax + wa * ray
+            rv_y = vby + wb * rbx - vay - wa * rax
 
             # Relative velocity along the normal
-            contact_vel = jcs_math.dot_product(rv, self.normal)
-
-            # No need to resolve if velocitie are separating
-            if contact_vel > 0:
-                return
-
-            ra_cross_n = jcs_math.cross_product(ra, self.normal)
-            rb_cross_n = jcs_math.cross_product(rb, self.normal)
-            inv_mass_sum = (self.bodyA.get_inverse_mass() +
-                            self.bodyB.get_inverse_mass() +
-                            (ra_cross_n * ra_cross_n) *
-                            self.bodyA.get_inverse_inertia() +
-                            (rb_cross_n * rb_cross_n) *
-                            self.bodyB.get_inverse_inertia())
+            contact_vel = rv_x * nx + rv_y * ny
 
             # Calculate impulse scalar
-            j = -(1.0 + self.mixed_restitution) * contact_vel
-            j /= inv_mass_sum
-            j /= float(self.contact_count)
+            normal_mass = self.normal_masses[index]
+            j = (self.velocity_biases[index] - contact_vel) * normal_mass
+
+            # Clamp the accumulated impulse, contact can only push
+            old_impulse = self.normal_impulses[index]
+            normal_impulse = max(old_impulse + j, 0.0)
+            self.normal_impulses[index] = normal_impulse
+            j = normal_impulse - old_impulse
+            if normal_mass > 0.0:
+                max_change = max(max_change, abs(j) / normal_mass)
 
             # Apply impulse
-            impulse = self.normal * j
-            self.bodyA.apply_impulse(-impulse, ra)
-            self.bodyB.apply_impulse(impulse, rb)
+            px = nx * j
+            py = ny * j
+            vax -= inverse_massA * px
+            vay -= inverse_massA * py
+            wa -= inverse_inertiaA * (rax * py - ray * px)
+            vbx += inverse_massB * px
+            vby += inverse_massB * py
+            wb += inverse_inertiaB * (rbx * py - rby * px)
 
             # Friction impulse
-            rv = (self.bodyB.get_velocity() +
-                  jcs_math.cross_product_fv(
-                      self.bodyB.get_angular_velocity(), rb) -
-                  self.bodyA.get_velocity() -
-                  jcs_math.cross_product_fv(
-                      self.bodyA.get_angular_velocity(), ra))
-
-            t = rv - (self.normal * jcs_math.dot_product(rv, self.normal))
-            t.normalize()
+            rv_x = vbx - wb * rby - vax + wa * ray
+            rv_y = vby + wb * rbx - vay - wa * rax
 
             # j tangent magnitude
-            jt = -jcs_math.dot_product(rv, t)
-            jt /= inv_mass_sum
-            jt /= self.contact_count
-
-            # Do not apply tiny friction impulses
-            if jcs_math.safe_equal(jt, 0.0):
-                return
-
-            # Coulumb's law
-            tangentImpulse = Vector2()
-            if jcs_math.absolute_value(jt) < j * self.mixed_static_friction :
-                tangentImpulse = t * jt
-            else:
-                tangentImpulse = t * -j * self.mixed_dynamic_friction
+            tangent_mass = self.tangent_masses[index]
+            jt = -(rv_x * tx + rv_y * ty) * tangent_mass
+
+            # Coulumb's law, clamp the accumulated friction to the
+            # friction cone. The accumulated impulse hold while the
+            # contact slide, so it take the dynamic friction.
+            old_impulse = self.tangent_impulses[index]
+            max_friction = self.mixed_dynamic_friction * normal_impulse
+            new_impulse = max(-max_friction, min(old_impulse + jt, max_friction))
+            self.tangent_impulses[index] = new_impulse
+            jt = new_impulse - old_impulse
+            if tangent_mass > 0.0:
+                max_change = max(max_change, abs(jt) / tangent_mass)
 
             # Apply friction impulse
-            self.bodyA.apply_impulse(-tangentImpulse, ra)
-            self.bodyB.apply_impulse(tangentImpulse, rb)
+            px = tx * jt
+            py = ty * jt
+            vax -= inverse_massA * px
+            vay -= inverse_massA * py
+            wa -= inverse_inertiaA * (rax * py - ray * px)
+            vbx += inverse_massB * px
+            vby += inverse_massB * py
+            wb += inverse_inertiaB * (rbx * py - rby * px)
+
+        velocityA.set_xy(vax, vay)
+        velocityB.set_xy(vbx, vby)
+        bodyA.angular_velocity = wa
+        bodyB.angular_velocity = wb
+
+        return max_change
 
     def positional_correction(self):
         """Naive correction of positional penetration."""
         slop = 0.05
         percent = 0.4
 
-        # NOTE(jenchieh): This return 'Vector2' because of
-        # 'self.normal' is type of Vector2
+        # Length of the correction along 'self.normal', the bodies
+        # are moved in place.
         correction = (
             max(self.penetration - slop, 0.0) /
-            (self.bodyA.get_inverse_mass() +
-             self.bodyB.get_inverse_mass())
-                      * self.normal
+            (self.bodyA.inverse_mass +
+             self.bodyB.inverse_mass)
                       * percent)
 
-        self.bodyA.position -= correction * self.bodyA.get_inverse_mass()
-        self.bodyB.position += correction * self.bodyB.get_inverse_mass()
+        # static body never move, keep its cached bounds.
+        if self.bodyA.inverse_mass != 0:
+            self.bodyA.position.sub_scaled(self.normal, correction * self.bodyA.inverse_mass)
+            self.bodyA.mark_transform_dirty()
+        if self.bodyB.inverse_mass != 0:
+            self.bodyB.position.add_scaled(self.normal, correction * self.bodyB.inverse_mass)
+            self.bodyB.mark_transform_dirty()
 
     def infinite_mass_correction(self):
         """Set both shape's velocity to zero."""
@@ -229,6 +413,18 @@ class Manifold(object):
         shapeB_vel.set_x(0)
         shapeB_vel.set_y(0)
 
+    @staticmethod
+    def resting_speed_sqr(deltaTime):
+        """
+        Squared speed gravity alone give in one step, contact
+        slower than this is resting and does not bounce.
+        @param { float } deltaTime : time step.
+        @return { float } : squared speed.
+        """
+        gravity = Physics.GRAVITY
+        return (jcs_math.sqr(deltaTime * gravity.x) +
+                jcs_math.sqr(deltaTime * gravity.y) + Physics.EPSILON)
+
     #====================
     # Protected Methods
 
@@ -238,8 +434,8 @@ class Manifold(object):
     #====================
     # setter / getter
     def set_normal(self, val):
-        """ @param{ Vector2 } val : vector normal. """
-        self.normal = val
+        """ @param{ Vector2 } val : vector normal, copied. """
+        self.normal.set_xy(val.x, val.y)
 
     def get_normal(self):
         """ @return { Vector2 } : vector 2 real number. """
@@ -263,8 +459,8 @@ class Manifold(object):
 
     def set_contacts_at(self, index, newContact):
         """ @param { int } index : set the contact at index.
-            @param { Vector2 } newContact : new contact info. """
-        self.contacts[index] = newContact
+            @param { Vector2 } newContact : new contact info, copied. """
+        self.contacts[index].set_xy(newContact.x, newContact.y)
 
     def get_contacts_at(self, index):
         """ @return { Vector2 } """
@@ -23,6 +23,7 @@ class Mat2(object):
     #*********************************************#
     #*             Public Variables              *#
     #*********************************************#
+    __slots__ = ('m00', 'm01', 'm10', 'm11')
 
     #*********************************************#
     #              Private Variables             *#
@@ -81,8 +82,8 @@ class Mat2(object):
     def __mul__(self, other):
         if isinstance(other, vector2.Vector2):
             return vector2.Vector2(
-                self.m00 * other.get_x() + self.m01 * other.get_y(),
-                self.m10 * other.get_x() + self.m11 * other.get_y())
+                self.m00 * other.x + self.m01 * other.y,
+                self.m10 * other.x + self.m11 * other.y)
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -0,0 +1,117 @@
+# ========================================================================
+# $File: pair_cache.py $
+# $Date: 2026-10-18 13:10:26 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.manifold import Manifold
+
+
+class PairCache(object):
+    """
+    @class PairCache
+    @brief Keep one manifold alive per shape pair while the pair
+    stay in broadphase contact, so the manifold does not get
+    allocate again every step.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        # { (Shape, Shape) : Manifold } : manifold of each pair.
+        self.manifolds = {}
+
+        # current step, pair not touched this step get evicted.
+        self.step_stamp = 0
+
+        # manifolds created / evicted during the last step.
+        self.created_count = 0
+        self.evicted_count = 0
+
+    #====================
+    # Public Methods
+    def begin_step(self):
+        """Call before looking up the pairs of this step."""
+        self.step_stamp += 1
+        self.created_count = 0
+
+    def get_manifold(self, shapeA, shapeB):
+        """
+        Return the manifold of this pair, reset and ready to solve.
+        @param { Shape } shapeA : first shape.
+        @param { Shape } shapeB : second shape.
+        @return { Manifold } : manifold of the pair.
+        """
+
+        key = (shapeA, shapeB)
+        manifold = self.manifolds.get(key)
+
+        if manifold is None:
+            manifold = Manifold(shapeA, shapeB)
+            self.manifolds[key] = manifold
+            self.created_count += 1
+        else:
+            manifold.reset()
+
+        manifold.pair_stamp = self.step_stamp
+        return manifold
+
+    def keep_manifold(self, shapeA, shapeB):
+        """
+        Keep the manifold of a pair not solved this step, e.g. both
+        shapes sleeping. Its contacts stay as they were last solved.
+        @param { Shape } shapeA : first shape.
+        @param { Shape } shapeB : second shape.
+        @return { Manifold } : manifold of the pair, None if the
+        pair has none.
+        """
+        manifold = self.manifolds.get((shapeA, shapeB))
+        if manifold is not None:
+            manifold.pair_stamp = self.step_stamp
+        return manifold
+
+    def end_step(self):
+        """Evict the manifold of the pairs that were not look up
+        this step, those pairs have separated."""
+
+        stamp = self.step_stamp
+        stale = [key for key, manifold in self.manifolds.items()
+                 if manifold.pair_stamp != stamp]
+
+        for key in stale:
+            del self.manifolds[key]
+
+        self.evicted_count = len(stale)
+
+    def clear(self):
+        """Remove all the manifolds."""
+        self.manifolds.clear()
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
+    def get_pair_count(self):
+        return len(self.manifolds)
@@ -21,6 +21,15 @@ class Physics(object):
     GRAVITY_SCALE = 15.0
     GRAVITY = vector2.Vector2(0, 9.81 * GRAVITY_SCALE)
     EPSILON = 0.0001
+    # contact approaching slower than this does not bounce.
+    RESTITUTION_VELOCITY_THRESHOLD = 1.0 * GRAVITY_SCALE
+    # impulse solver stop once a pass change no contact velocity
+    # more than this.
+    SOLVER_VELOCITY_TOLERANCE = 0.01 * GRAVITY_SCALE
+    # body slower than this for 'TIME_TO_SLEEP' seconds go to sleep.
+    SLEEP_LINEAR_TOLERANCE = 0.2 * GRAVITY_SCALE
+    SLEEP_ANGULAR_TOLERANCE = 0.1
+    TIME_TO_SLEEP = 0.5
 
     # --------------------------------------------
     # Private Variables
@@ -104,30 +113,32 @@ class Physics(object):
     def integrate_forces(shape, deltaTime):
         """SEE: http://www.niksula.hut.fi/~hkankaan/Homepages/gravity.html"""
 
-        tmpBody = shape.get_rigidbody()
+        tmpBody = shape.rigidbody
 
-        if tmpBody.get_inverse_mass() == 0.0:
+        if tmpBody.inverse_mass == 0.0 or tmpBody.is_sleeping:
             return
 
         halfDeltaTime = deltaTime * 0.5
 
-        tmpBody.velocity += (tmpBody.get_force() * tmpBody.get_inverse_mass() + Physics.GRAVITY) * halfDeltaTime
-        tmpBody.angular_velocity += tmpBody.torque * tmpBody.get_inverse_inertia() * halfDeltaTime
+        tmpBody.velocity.add_scaled(tmpBody.force, tmpBody.inverse_mass * halfDeltaTime)
+        tmpBody.velocity.add_scaled(Physics.GRAVITY, halfDeltaTime)
+        tmpBody.angular_velocity += tmpBody.torque * tmpBody.inverse_inertia * halfDeltaTime
 
     @staticmethod
     def integrate_velocity(shape, deltaTime):
         """Start the velocity in physics world."""
-        tmpBody = shape.get_rigidbody()
+        tmpBody = shape.rigidbody
 
-        if tmpBody.get_inverse_mass() == 0.0:
+        if tmpBody.inverse_mass == 0.0 or tmpBody.is_sleeping:
             return
 
-        tmpBody.position += tmpBody.velocity * deltaTime
+        tmpBody.position.add_scaled(tmpBody.velocity, deltaTime)
         # STUDY(jenchieh): angular_velocity is too small
         # and cannot be add up.
         tmpBody.orientation += (tmpBody.angular_velocity * deltaTime)
 
-        tmpBody.set_orientation(tmpBody.orientation)
+        # also mark the transform dirty.
+        tmpBody.update_orientation(tmpBody.orientation)
         Physics.integrate_forces(shape, deltaTime)
 
 
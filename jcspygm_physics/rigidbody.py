@@ -21,6 +21,15 @@ class Rigidbody(object):
     #*********************************************#
     #*             Public Variables              *#
     #*********************************************#
+    __slots__ = ('shape',
+                 'position', 'velocity', 'acceleration',
+                 'orientation', 'angular_velocity', 'torque',
+                 'inertia', 'inverse_inertia', 'inverse_mass', 'mass',
+                 'static_friction', 'dynamic_friction', 'restitution',
+                 'force', 'is_static', 'transform_version',
+                 'island_index', 'is_sleeping', 'sleep_time',
+                 'store', 'index',
+                 'position_view', 'velocity_view', 'force_view')
 
     #*********************************************#
     #              Private Variables             *#
@@ -63,6 +72,27 @@ class Rigidbody(object):
 
         self.is_static = False
 
+        # increase every time position or orientation change, shape
+        # use this to know when its cached data is out of date.
+        self.transform_version = 0
+
+        # index of the body while building islands, -1 for static.
+        self.island_index = -1
+
+        # Sleeping body is not integrated nor collided with other
+        # sleeping bodies. 'sleep_time' is how long the body has
+        # been slow enough to sleep.
+        self.is_sleeping = False
+        self.sleep_time = 0.0
+
+        # row of the body once a 'BodyStore' adopt it, see
+        # 'BodyHandle'.
+        self.store = None
+        self.index = -1
+        self.position_view = None
+        self.velocity_view = None
+        self.force_view = None
+
     #====================
     # Public Methods
     def apply_force(self, force):
@@ -70,6 +100,8 @@ class Rigidbody(object):
         Apply force.
         @param { Vector2 } force : another vector force.
         """
+        if self.is_sleeping:
+            self.wake()
         self.force += force
 
     def apply_impulse(self, impulse, contact_vec):
@@ -78,9 +110,29 @@ class Rigidbody(object):
         @param { Vector2 } impulse : Impulse.
         @param { Vector2 } contact_vec : contact point.
         """
-        self.velocity += self.inverse_mass * impulse
+        if self.is_sleeping:
+            self.wake()
+        self.velocity.add_scaled(impulse, self.inverse_mass)
         self.angular_velocity += self.inverse_inertia * jcs_math.cross_product(contact_vec, impulse)
 
+    def mark_transform_dirty(self):
+        """Call this after changing position or orientation so
+        the shape will recompute its cached bounds."""
+        self.transform_version += 1
+
+    def wake(self):
+        """Wake the body up, it is simulated again."""
+        self.is_sleeping = False
+        self.sleep_time = 0.0
+
+    def sleep(self):
+        """Put the body to sleep, it stop moving until woken up."""
+        self.is_sleeping = True
+        self.velocity.set_xy(0, 0)
+        self.angular_velocity = 0
+        self.force.set_xy(0, 0)
+        self.torque = 0
+
     def set_static(self):
         """Set the rigidbody static object in the world."""
         self.mass = 0
@@ -98,6 +150,12 @@ class Rigidbody(object):
 
     #====================
     # setter / getter
+    def set_position(self, x, y):
+        """Move the rigidbody by hand, this wake it up."""
+        self.position.set_xy(x, y)
+        self.mark_transform_dirty()
+        self.wake()
+
     def get_position(self):
         return self.position
 
@@ -105,15 +163,22 @@ class Rigidbody(object):
         return self.velocity
 
     def set_orientation(self, radians):
-        """Set orientation by passing in radians."""
+        """Rotate the rigidbody by hand, this wake it up."""
+        self.update_orientation(radians)
+        self.wake()
+
+    def update_orientation(self, radians):
+        """Set orientation by passing in radians, without waking
+        the rigidbody. The integrator call this every step."""
         self.orientation = radians
-        self.shape.set_orientation(radians)
+        self.shape.update_orientation(radians)
+        self.mark_transform_dirty()
 
     def get_orientation(self):
         return self.orientation
 
     def set_force(self, inForce):
-        self.force = inForce
+        self.force.set_xy(inForce.x, inForce.y)
 
     def get_force(self):
         return self.force
@@ -0,0 +1,107 @@
+# ========================================================================
+# $File: scratch_pool.py $
+# $Date: 2026-10-18 23:42:05 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.vector2 import Vector2
+
+
+class ScratchPool(object):
+    """
+    @class ScratchPool
+    @brief Vectors lent to the collision and solver code for the
+    temporaries of one routine, instead of creating new ones every
+    time. Vectors are created only when the pool run out, so once
+    the pool is big enough a step does not create any.
+
+        mark = pool.mark()
+        tmpVec = pool.borrow(x, y)
+        ...
+        pool.release(mark)
+
+    A borrowed vector belongs to the pool again once released, copy
+    it out with 'set_xy' to keep the value.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    INITIAL_CAPACITY = 16
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, capacity = INITIAL_CAPACITY):
+        """
+        Constructor.
+        @param { int } capacity : vectors created up front.
+        """
+
+        # { Vector2[] } : every vector of the pool, the first
+        # 'used_count' ones are lent out.
+        self.vectors = [Vector2() for count in range(0, capacity)]
+        self.used_count = 0
+
+    #====================
+    # Public Methods
+    def borrow(self, x = 0.0, y = 0.0):
+        """
+        Lend a vector until the matching 'release'.
+        @param { float } x : x of the vector.
+        @param { float } y : y of the vector.
+        @return { Vector2 } : vector set to (x, y).
+        """
+
+        if self.used_count == len(self.vectors):
+            self.vectors.append(Vector2())
+
+        tmpVec = self.vectors[self.used_count]
+        self.used_count += 1
+
+        tmpVec.x = x
+        tmpVec.y = y
+        return tmpVec
+
+    def mark(self):
+        """
+        @return { int } : position to give back to 'release'.
+        """
+        return self.used_count
+
+    def release(self, mark):
+        """
+        Take back every vector borrowed since 'mark'.
+        @param { int } mark : position return by 'mark'.
+        """
+        self.used_count = mark
+
+    def reset(self):
+        """Take back every vector, call this at the start of the
+        step in case a routine did not release."""
+        self.used_count = 0
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
+    def get_capacity(self):
+        return len(self.vectors)
+
+    def get_used_count(self):
+        return self.used_count
@@ -8,19 +8,21 @@
 # ========================================================================
 
 from jcspygm_physics.enum.shape_type import ShapeType
-from jcspygm.core.JCSPyGm_GameObject import JCSPyGm_GameObject
+from jcspygm_physics.aabb import AABB
 
 
-class Shape(JCSPyGm_GameObject):
+class Shape(object):
     """
     @class Shape
-    @brief Shape base class. Inherit to 'JCSPyGm_GameObject' just
-    to use the render layer.
+    @brief Shape base class. Know nothing about rendering, the
+    game draw it through a 'ShapeRenderer'.
     """
 
     #*********************************************#
     #*             Public Variables              *#
     #*********************************************#
+    DEFAULT_CATEGORY_BITS = 0x0001
+    DEFAULT_MASK_BITS = 0xFFFF
 
     #*********************************************#
     #              Private Variables             *#
@@ -44,6 +46,20 @@ class Shape(JCSPyGm_GameObject):
 
         self.thickness = 1
 
+        # { AABB } : world space bounds, use by broadphase.
+        self.aabb = AABB()
+        # rigidbody 'transform_version' the bounds were computed at.
+        self.aabb_version = -1
+
+        # radius of the circle around the body position that hold
+        # the whole shape, use to reject pairs before narrowphase.
+        self.bounding_radius = 0.0
+
+        # Collision filtering, two shapes collide only if each
+        # category is in the other's mask.
+        self.category_bits = Shape.DEFAULT_CATEGORY_BITS
+        self.mask_bits = Shape.DEFAULT_MASK_BITS
+
         self.initialize()
 
     #====================
@@ -61,7 +77,20 @@ class Shape(JCSPyGm_GameObject):
         """
 
     def set_orientation(self, radians):
-        """Set the shape orientation by radians.
+        """Set the shape orientation by radians, this wake the
+        rigidbody up."""
+        self.update_orientation(radians)
+        self.rigidbody.wake()
+
+    def update_orientation(self, radians):
+        """Set the shape orientation by radians without waking the
+        rigidbody, the integrator call this every step.
+
+        IMPORTANT: override this...
+        """
+
+    def compute_aabb(self, aabb):
+        """Compute the world space bounds into 'aabb'.
 
         IMPORTANT: override this...
         """
@@ -78,6 +107,34 @@ class Shape(JCSPyGm_GameObject):
         """Return the enum type of shape."""
         return self.type
 
+    def set_collision_filter(self, category_bits, mask_bits):
+        """
+        Set the collision layers of this shape.
+        @param { int } category_bits : layers this shape belongs to.
+        @param { int } mask_bits : layers this shape collides with.
+        """
+        self.category_bits = category_bits
+        self.mask_bits = mask_bits
+
+    def get_category_bits(self):
+        return self.category_bits
+
+    def get_mask_bits(self):
+        return self.mask_bits
+
+    def get_bounding_radius(self):
+        return self.bounding_radius
+
+    def get_aabb(self):
+        """Return the world space bounds of this shape. Only
+        recompute when the rigidbody has moved since last time, so
+        static shape compute it once."""
+        body = self.rigidbody
+        if self.aabb_version != body.transform_version:
+            self.compute_aabb(self.aabb)
+            self.aabb_version = body.transform_version
+        return self.aabb
+
     def get_rigidbody(self):
         return self.rigidbody
 
@@ -7,16 +7,11 @@
 #                   Copyright (c) 2017 by Shen, Jen-Chieh $
 # ========================================================================
 
-from jcspygm.util.JCSPyGm_Debug import JCSPyGm_Debug
 from jcspygm_physics.enum.shape_type import ShapeType
 from jcspygm_physics.shape import Shape
 from jcspygm_physics.rigidbody import Rigidbody
 
-from jcspygm_physics.vector2 import Vector2
-
 import jcspygm_physics.jcs_math
-import math
-import pygame
 
 class Circle(Shape):
     """
@@ -45,6 +40,7 @@ class Circle(Shape):
         super(Circle, self).__init__()
 
         self.radius = radius
+        self.bounding_radius = radius
         self.type = ShapeType.CIRCLE
 
         # override rigidbody
@@ -55,62 +51,24 @@ class Circle(Shape):
 
     #====================
     # Public Methods
-    def update(self, deltaTime):
-        """Update shape game logic"""
-
-        # Do nothing if the body is not avaliable.
-        if self.rigidbody is None:
-            JCSPyGm_Debug.Log("There is shape without rigidbody in the scene...")
-            return
-
-    def draw(self, windowInfo):
-        """Start render."""
-
-        # Do nothing if the body is not avaliable.
-        if self.rigidbody is None:
-            JCSPyGm_Debug.Log("There is shape without rigidbody in the scene...")
-            return
-
-        # Render circle.
-
-        draw_pos_x = int(self.rigidbody.get_position().get_x())
-        draw_pos_y = int(self.rigidbody.get_position().get_y())
-
-        pygame.draw.circle(
-            windowInfo,
-            self.color,
-            (draw_pos_x, draw_pos_y),
-            self.radius,
-            self.thickness)
-
-        # Render line within circle so orientation is visible
-        line_vertices = []
-
-        r = Vector2(0.0, 1.0)
-        c = math.cos(self.rigidbody.get_orientation())
-        s = math.sin(self.rigidbody.get_orientation())
-        r.set_xy(r.x * c - r.y * s, r.x * s + r.y * c)
-        r *= self.radius
-        r += self.rigidbody.get_position()
-
-        line_vertices.append((draw_pos_x, draw_pos_y))
-        line_vertices.append((r.x, r.y))
-
-        pygame.draw.lines(
-            windowInfo,
-            self.color,
-            False,
-            line_vertices)
-
     def compute_mass(self, density):
         """Compute the mass by density."""
         self.rigidbody.set_mass(jcspygm_physics.jcs_math.PI * self.radius * self.radius * density)
         self.rigidbody.set_inertia(self.rigidbody.get_mass() * self.radius * self.radius)
 
-    def set_orientation(self, radians):
+    def update_orientation(self, radians):
         """Set the shape orientation by radians."""
         # Every shape have to override this...
 
+    def compute_aabb(self, aabb):
+        """Compute the world space bounds into 'aabb'."""
+        pos = self.rigidbody.position
+        aabb.set_bounds(
+            pos.x - self.radius,
+            pos.y - self.radius,
+            pos.x + self.radius,
+            pos.y + self.radius)
+
     #====================
     # Protected Methods
 
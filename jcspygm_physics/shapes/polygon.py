@@ -7,7 +7,6 @@
 #                   Copyright (c) 2017 by Shen, Jen-Chieh $
 # ========================================================================
 
-from jcspygm.util.JCSPyGm_Debug import JCSPyGm_Debug
 from jcspygm_physics.enum.shape_type import ShapeType
 from jcspygm_physics.shape import Shape
 
@@ -17,7 +16,11 @@ from  jcspygm_physics.vector2 import Vector2
 from jcspygm_physics.physics import Physics
 import jcspygm_physics.jcs_math
 
-import pygame
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
 
 class Polygon(Shape):
     """
@@ -64,47 +67,27 @@ class Polygon(Shape):
         self.vertex_count = 0
         self.normals = []
 
-        # Initialize the two vector2's array.
+        # { Vector2[] } : vertices and normals in world space, only
+        # recompute when the rigidbody has moved.
+        self.world_vertices = []
+        self.world_normals = []
+        self.world_version = -1
+
+        # vertex the last support query ended on, next query start
+        # climbing from here.
+        self.support_index = 0
+
+        # Initialize the vector2's array.
         for count in range(0, Polygon.MAX_POLY_VERTEX_COUNT):
             self.vertices.append(Vector2())
             self.normals.append(Vector2())
+            self.world_vertices.append(Vector2())
+            self.world_normals.append(Vector2())
 
         self.density = density
 
     #====================
     # Public Methods
-    def update(self, deltaTime):
-        """Update shape game logic"""
-
-        # Do nothing if the body is not avaliable.
-        if self.rigidbody is None:
-            JCSPyGm_Debug.Log("There is shape without rigidbody in the scene...")
-            return
-
-    def draw(self, windowInfo):
-        """Start render."""
-
-        # Do nothing if the body is not avaliable.
-        if self.rigidbody is None:
-            JCSPyGm_Debug.Log("There is shape without rigidbody in the scene...")
-
-        draw_vertices = []
-
-        for index in range(0, self.vertex_count):
-            tmpVec = (self.rigidbody.get_position() +
-                      self.orientation *
-                      self.vertices[index])
-            tmpPoint = (tmpVec.get_x(), tmpVec.get_y())
-
-            # add to vertices list.
-            draw_vertices.append(tmpPoint)
-
-        pygame.draw.polygon(
-            windowInfo,
-            self.color,
-            draw_vertices,
-            self.thickness)
-
     def compute_mass(self, density):
         """Compute the mass by density."""
 
@@ -137,7 +120,9 @@ class Polygon(Shape):
 
         # check area.
         if area == 0:
-            JCSPyGm_Debug.Log("Polygon shape's area is zero???")
+            logger.warning("Polygon shape's area is zero???")
+            # still bound it, a zero radius would cull every pair.
+            self.compute_bounding_radius()
             return
 
         centroid *= 1.0 / area
@@ -148,13 +133,64 @@ class Polygon(Shape):
         for index in range(0, self.vertex_count):
             self.vertices[index] -= centroid
 
+        self.compute_bounding_radius()
+
         self.rigidbody.set_mass(density * area)
         self.rigidbody.set_inertia(I * density)
 
 
-    def set_orientation(self, radians):
+    def update_orientation(self, radians):
         """Set the shape orientation by radians."""
         self.orientation.set_mat_by_radians(radians)
+        self.rigidbody.mark_transform_dirty()
+
+    def compute_aabb(self, aabb):
+        """Compute the world space bounds into 'aabb'."""
+        world_vertices = self.get_world_vertices()
+
+        min_x = min_y = jcspygm_physics.jcs_math.FLT_MAX
+        max_x = max_y = -jcspygm_physics.jcs_math.FLT_MAX
+
+        for index in range(0, self.vertex_count):
+            v = world_vertices[index]
+            x = v.x
+            y = v.y
+
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+        aabb.set_bounds(min_x, min_y, max_x, max_y)
+
+    def update_world_vertices(self):
+        """Transform vertices and normals to world space. Do nothing
+        if the rigidbody has not moved since last time, so every
+        collision this step share the same transform."""
+
+        body = self.rigidbody
+        if self.world_version == body.transform_version:
+            return
+        self.world_version = body.transform_version
+
+        m = self.orientation
+        px = body.position.x
+        py = body.position.y
+
+        for index in range(0, self.vertex_count):
+            v = self.vertices[index]
+            n = self.normals[index]
+
+            self.world_vertices[index].set_xy(
+                m.m00 * v.x + m.m01 * v.y + px,
+                m.m10 * v.x + m.m11 * v.y + py)
+            self.world_normals[index].set_xy(
+                m.m00 * n.x + m.m01 * n.y,
+                m.m10 * n.x + m.m11 * n.y)
 
     def set_box(self, half_width, half_height):
         """Set polygon to perfect box shape."""
@@ -171,6 +207,7 @@ class Polygon(Shape):
         self.normals[3].set_xy(-1.0, 0.0)
 
         self.compute_mass(self.density)
+        self.rigidbody.mark_transform_dirty()
 
     def set_rand_convex_poly(self, vertices, count):
         """
@@ -181,7 +218,7 @@ class Polygon(Shape):
 
         # No hulls with less than 3 vertices (ensure actual polygon)
         if (count > 2 and count <= Polygon.MAX_POLY_VERTEX_COUNT) is False:
-            JCSPyGm_Debug.Error("No hulls with less than 3 vertices (ensure actual polygon).")
+            logger.error("No hulls with less than 3 vertices (ensure actual polygon).")
 
         count = min(count, Polygon.MAX_POLY_VERTEX_COUNT)
 
@@ -246,9 +283,11 @@ class Polygon(Shape):
                 self.vertex_count = out_count
                 break
 
-        # Copy vertices into shape's vertices
+        # Copy vertices into shape's vertices, they are changed in
+        # place by 'compute_mass'.
         for index in range(0, self.vertex_count):
-            self.vertices[index] = vertices[hull[index]]
+            tmpVertex = vertices[hull[index]]
+            self.vertices[index].set_xy(tmpVertex.x, tmpVertex.y)
 
         # Compute face normals
         for index in range(0, self.vertex_count):
@@ -260,7 +299,7 @@ class Polygon(Shape):
 
             # Ensure no zero-length edges, because that's bad
             if (face.len_sqr() > Physics.EPSILON * Physics.EPSILON) is False:
-                JCSPyGm_Debug.Error("Ensure no zero-length edges, because that's bad...")
+                logger.error("Ensure no zero-length edges, because that's bad...")
 
             # Calculate normal with 2D cross product
             # between vector and scalar
@@ -269,6 +308,7 @@ class Polygon(Shape):
 
         # set the mass.
         self.compute_mass(self.density)
+        self.rigidbody.mark_transform_dirty()
 
     def get_support(self, in_direction):
         """
@@ -278,27 +318,95 @@ class Polygon(Shape):
         within a polygon.
         """
 
-        best_projection = -3.4028235e38
-        best_vertex = Vector2()
+        if self.vertex_count == 0:
+            return Vector2()
 
-        for index in range(0, self.vertex_count):
-            v = self.vertices[index]
-            projection = jcspygm_physics.jcs_math.dot_product(v, in_direction)
-            
-            if projection > best_projection:
-                best_vertex = v
-                best_projection = projection
-
-        return best_vertex
+        self.support_index = self.climb_support(
+            self.vertices, in_direction.x, in_direction.y)
+        return self.vertices[self.support_index]
 
+    def get_world_support_index(self, dx, dy):
+        """
+        Index of the extreme world space vertex along a direction.
+        @param { float } dx : direction on x-axis.
+        @param { float } dy : direction on y-axis.
+        @return { int } : index in the world vertices.
+        """
+        self.support_index = self.climb_support(
+            self.get_world_vertices(), dx, dy)
+        return self.support_index
 
     #====================
     # Protected Methods
 
     #====================
     # Private Methods
+    def compute_bounding_radius(self):
+        """Farthest vertex from the model origin bound the polygon."""
+        bounding_radius_sqr = 0.0
+        for index in range(0, self.vertex_count):
+            bounding_radius_sqr = max(bounding_radius_sqr,
+                                      self.vertices[index].len_sqr())
+        self.bounding_radius = math.sqrt(bounding_radius_sqr)
+
+    def climb_support(self, vertices, dx, dy):
+        """
+        Walk the hull from the last support vertex toward the
+        direction until no neighbour go further. Polygon is convex
+        so the first local maximum is the support point, and the
+        walk is short when the direction change a little between
+        queries.
+        @param { Vector2[] } vertices : model or world vertices.
+        @param { float } dx : direction on x-axis.
+        @param { float } dy : direction on y-axis.
+        @return { int } : index of the support vertex.
+        """
+
+        count = self.vertex_count
+
+        index = self.support_index
+        if index >= count:
+            index = 0
+
+        v = vertices[index]
+        best_projection = v.x * dx + v.y * dy
+
+        while True:
+            next_index = index + 1
+            if next_index == count:
+                next_index = 0
+
+            v = vertices[next_index]
+            projection = v.x * dx + v.y * dy
+            if projection > best_projection:
+                best_projection = projection
+                index = next_index
+                continue
+
+            prev_index = index - 1
+            if prev_index < 0:
+                prev_index = count - 1
+
+            v = vertices[prev_index]
+            projection = v.x * dx + v.y * dy
+            if projection > best_projection:
+                best_projection = projection
+                index = prev_index
+                continue
+
+            return index
 
     #====================
     # setter / getter
     def get_vertex_count(self):
         return self.vertex_count
+
+    def get_world_vertices(self):
+        """ @return { Vector2[] } : vertices in world space. """
+        self.update_world_vertices()
+        return self.world_vertices
+
+    def get_world_normals(self):
+        """ @return { Vector2[] } : face normals in world space. """
+        self.update_world_vertices()
+        return self.world_normals
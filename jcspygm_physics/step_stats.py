@@ -0,0 +1,86 @@
+# ========================================================================
+# $File: step_stats.py $
+# $Date: 2026-10-18 09:31:05 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+
+class StepStats(object):
+    """
+    @class StepStats
+    @brief Counters collect during one physics step, use for
+    profiling the engine.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self):
+        """Constructor."""
+
+        self.reset()
+
+    #====================
+    # Public Methods
+    def reset(self):
+        """Clear all counters, call this at the start of the step."""
+
+        # pairs the broadphase hand to the narrowphase.
+        self.candidate_pair_count = 0
+        # part of the candidate pairs found in the static index.
+        self.static_pair_count = 0
+        # candidate pairs skipped by the collision layers.
+        self.filtered_pair_count = 0
+        # pairs that actually generate contact points.
+        self.contact_pair_count = 0
+        # manifolds allocated by the pair cache.
+        self.new_manifold_count = 0
+        # polygon pairs rejected / not rejected by the axis cached
+        # from last step. Only the scalar path count here, pairs
+        # collided in a NumPy batch ('World.batch_polygons') do not
+        # use the cache.
+        self.axis_cache_hit_count = 0
+        self.axis_cache_miss_count = 0
+        # pairs rejected by the bounding circle test.
+        self.bounding_reject_count = 0
+        # impulse solver passes run before converging, most of
+        # any island.
+        self.iterations_used = 0
+        # islands solved and the shape count of the biggest one.
+        self.island_count = 0
+        self.max_island_size = 0
+        # candidate pairs skipped because no shape is awake.
+        self.sleeping_pair_count = 0
+        # bodies sleeping at the end of the step.
+        self.sleeping_body_count = 0
+        # colours of the contact graph, and the contact count of
+        # each colour batch, when solving with the array solver.
+        self.color_count = 0
+        self.color_batch_sizes = []
+        # vectors created by the collision scratch pool so far, stop
+        # growing once the steps are creating no vector.
+        self.scratch_vector_count = 0
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+
+    #====================
+    # setter / getter
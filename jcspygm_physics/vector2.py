@@ -21,6 +21,10 @@ class Vector2(object):
     # Public Variables
     # --------------------------------------------
 
+    # No per instance dict, vectors are created by the thousand
+    # every step.
+    __slots__ = ('x', 'y')
+
     # --------------------------------------------
     # Private Variables
     # --------------------------------------------
@@ -78,7 +82,7 @@ class Vector2(object):
 
     def __add__(self, other):
         if isinstance(other, Vector2):
-            return Vector2(self.x + other.get_x(), self.y + other.get_y())
+            return Vector2(self.x + other.x, self.y + other.y)
         else:
             return Vector2(self.x + other, self.y + other)
 
@@ -87,7 +91,7 @@ class Vector2(object):
 
     def __sub__(self, other):
         if isinstance(other, Vector2):
-            return Vector2(self.x - other.get_x(), self.y - other.get_y())
+            return Vector2(self.x - other.x, self.y - other.y)
         else:
             return Vector2(self.x - other, self.y - other)
 
@@ -96,7 +100,7 @@ class Vector2(object):
 
     def __mul__(self, other):
         if isinstance(other, Vector2):
-            return Vector2(self.x * other.get_x(), self.y * other.get_y())
+            return Vector2(self.x * other.x, self.y * other.y)
         else:
             return Vector2(self.x * other, self.y * other)
 
@@ -105,13 +109,93 @@ class Vector2(object):
 
     def __div__(self, other):
         if isinstance(other, Vector2):
-            return Vector2(self.x / other.get_x(), self.y / other.get_y())
+            return Vector2(self.x / other.x, self.y / other.y)
         else:
             return Vector2(self.x / other, self.y / other)
 
     def __rdiv__(self, other):
         return self.__div__(other)
 
+    # In place operators, change this vector instead of creating
+    # a new one. Anything holding this vector sees the change.
+    def __iadd__(self, other):
+        if isinstance(other, Vector2):
+            self.x += other.x
+            self.y += other.y
+        else:
+            self.x += other
+            self.y += other
+        return self
+
+    def __isub__(self, other):
+        if isinstance(other, Vector2):
+            self.x -= other.x
+            self.y -= other.y
+        else:
+            self.x -= other
+            self.y -= other
+        return self
+
+    def __imul__(self, other):
+        if isinstance(other, Vector2):
+            self.x *= other.x
+            self.y *= other.y
+        else:
+            self.x *= other
+            self.y *= other
+        return self
+
+    def __idiv__(self, other):
+        if isinstance(other, Vector2):
+            self.x /= other.x
+            self.y /= other.y
+        else:
+            self.x /= other
+            self.y /= other
+        return self
+
+    def add_scaled(self, other, scale):
+        """Do 'self += other * scale' without the temporary.
+        @param { Vector2 } other : vector to add.
+        @param { float } scale : scale of 'other'.
+        @return { Vector2 } : this vector.
+        """
+        self.x += other.x * scale
+        self.y += other.y * scale
+        return self
+
+    def sub_scaled(self, other, scale):
+        """Do 'self -= other * scale' without the temporary.
+        @param { Vector2 } other : vector to subtract.
+        @param { float } scale : scale of 'other'.
+        @return { Vector2 } : this vector.
+        """
+        self.x -= other.x * scale
+        self.y -= other.y * scale
+        return self
+
+    def set_cross_fv(self, val, vec):
+        """Set this vector to 'cross_product_fv(val, vec)'.
+        @param { float } val : real number.
+        @param { Vector2 } vec : vector2, may be this vector.
+        @return { Vector2 } : this vector.
+        """
+        tmpX = -val * vec.y
+        self.y = val * vec.x
+        self.x = tmpX
+        return self
+
+    def set_cross_vf(self, vec, val):
+        """Set this vector to 'cross_product_vf(vec, val)'.
+        @param { Vector2 } vec : vector2, may be this vector.
+        @param { float } val : real number.
+        @return { Vector2 } : this vector.
+        """
+        tmpX = val * vec.y
+        self.y = -val * vec.x
+        self.x = tmpX
+        return self
+
     # --------------------------------------------
     # Protected Methods
     # --------------------------------------------
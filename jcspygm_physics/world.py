@@ -0,0 +1,582 @@
+# ========================================================================
+# $File: world.py $
+# $Date: 2026-10-18 21:46:03 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+from jcspygm_physics.physics import Physics
+from jcspygm_physics.collision import Collision
+from jcspygm_physics.manifold import Manifold
+from jcspygm_physics.batch_collision import BatchCollision
+from jcspygm_physics.contact_solver import ContactSolver
+from jcspygm_physics.contact_coloring import ContactColoring
+from jcspygm_physics.body_store import BodyStore
+from jcspygm_physics.enum.shape_type import ShapeType
+from jcspygm_physics.pair_cache import PairCache
+from jcspygm_physics.island import Island
+from jcspygm_physics.step_stats import StepStats
+from jcspygm_physics.broadphase.dynamic_tree import DynamicTree
+from jcspygm_physics.broadphase.static_index import StaticIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class World(object):
+    """
+    @class World
+    @brief Physics simulation without any window or render layer.
+    Own the shapes, the contacts and the solver settings, 'step'
+    advance it with a fixed time step whatever the frame time is.
+    """
+
+    #*********************************************#
+    #*             Public Variables              *#
+    #*********************************************#
+    DEFAULT_TIME_STEP = 1.0 / 60.0
+
+    # most fixed steps run by one 'step' call. A slow frame drop
+    # the time left over instead of running more and more steps.
+    MAX_STEPS_PER_UPDATE = 5
+
+    #*********************************************#
+    #              Private Variables             *#
+    #*********************************************#
+
+    #*********************************************#
+    #              Protected Variables           *#
+    #*********************************************#
+
+    #*********************************************#
+    #                Constructor                 *#
+    #*********************************************#
+    def __init__(self, time_step = DEFAULT_TIME_STEP, substeps = 1):
+        """
+        Constructor.
+        @param { float } time_step : fixed time step in seconds.
+        @param { int } substeps : steps the fixed time step is
+        split into, more substeps make stiff stacks more stable.
+        """
+
+        self.time_step = time_step
+        self.substeps = substeps
+
+        # frame time not simulated yet.
+        self.accumulator = 0.0
+
+        # manifold list.
+        self.contacts = []
+        # store all the shape in the world.
+        self.shapes = []
+
+        # Most iterations the impulse solver run per step. It stop
+        # early once the impulses settle, contacts are warm started
+        # so resting piles settle after a pass or two.
+        self.iterations = 10
+        self.velocity_tolerance = Physics.SOLVER_VELOCITY_TOLERANCE
+
+        # 'ContactSolver' solve the contacts of all awake islands in
+        # NumPy arrays, None use 'Manifold.apply_impulse' per contact.
+        self.contact_solver = None
+        # split the contacts in colours sharing no body before the
+        # array solver, else it solve all of them as one batch.
+        self.color_contacts = True
+
+        # 'BodyStore' keeping the bodies in NumPy arrays and
+        # integrating them all at once, None integrate each body.
+        self.body_store = None
+
+        # find the candidate pairs for the narrowphase. Tree handle
+        # the big static platform mix with small shapes.
+        self.broadphase = DynamicTree(DynamicTree.DEFAULT_MARGIN)
+
+        # static shapes are kept apart, dynamic shapes query them.
+        self.static_index = StaticIndex()
+
+        # reuse the manifold of each pair across steps.
+        self.pair_cache = PairCache()
+
+        # profiling counters of the last step.
+        self.stats = StepStats()
+
+        # islands of the last step.
+        self.islands = []
+
+        # bodies at rest long enough go to sleep.
+        self.allow_sleep = True
+        self.sleep_linear_tolerance = Physics.SLEEP_LINEAR_TOLERANCE
+        self.sleep_angular_tolerance = Physics.SLEEP_ANGULAR_TOLERANCE
+        self.time_to_sleep = Physics.TIME_TO_SLEEP
+
+        # collide circle pairs and polygon pairs together with
+        # NumPy when installed.
+        self.batch_circles = BatchCollision.HAS_NUMPY
+        self.batch_polygons = BatchCollision.HAS_NUMPY
+
+    #====================
+    # Public Methods
+    def add_shape(self, shape):
+        """
+        Add a shape to the simulation.
+        @param { Shape } shape : shape to add. Call 'set_static' on
+        its rigidbody before adding it if it is static.
+        """
+
+        self.shapes.append(shape)
+
+        # the rigidbody now read and write its row of the store.
+        if self.body_store is not None:
+            self.body_store.add_body(shape.rigidbody)
+
+        if shape.get_rigidbody().is_static:
+            self.static_index.add_shape(shape)
+        else:
+            self.broadphase.add_shape(shape)
+
+    def step(self, deltaTime):
+        """
+        Advance the simulation by the frame time, in as many fixed
+        steps as fit in the time accumulated so far.
+        @param { float } deltaTime : frame time in seconds.
+        @return { int } : fixed steps ran.
+        """
+
+        self.accumulator += deltaTime
+
+        step_count = 0
+        while self.accumulator >= self.time_step:
+            if step_count == World.MAX_STEPS_PER_UPDATE:
+                # too far behind, never catch up.
+                self.accumulator = 0.0
+                break
+
+            substep_time = self.time_step / self.substeps
+            for index in range(0, self.substeps):
+                self.simulate(substep_time)
+
+            self.accumulator -= self.time_step
+            step_count += 1
+
+        return step_count
+
+    def simulate(self, deltaTime):
+        """
+        Run exactly one step of the simulation.
+        @param { float } deltaTime : time step.
+        """
+
+        # Generate new collision info
+
+        # clear all contacs every frame.
+        del self.contacts[:]
+
+        self.stats.reset()
+
+        # only test the pairs that broadphase think might collide,
+        # broadphase only hold dynamic shapes.
+        self.broadphase.update()
+        pairs = self.broadphase.compute_pairs()
+
+        static_pairs = self.static_index.compute_pairs(self.broadphase.shapes)
+        self.stats.static_pair_count = len(static_pairs)
+        pairs.extend(static_pairs)
+
+        self.stats.candidate_pair_count = len(pairs)
+
+        self.pair_cache.begin_step()
+        Collision.reset_counters()
+        Collision.scratch_pool.reset()
+
+        circle_pairs = []
+        polygon_pairs = []
+
+        # only batch the pair types still using the default collider.
+        batch_circles = (self.batch_circles and
+                         Collision.get_collider(ShapeType.CIRCLE, ShapeType.CIRCLE)
+                         is Collision.circle_to_circle)
+        batch_polygons = (self.batch_polygons and
+                          Collision.get_collider(ShapeType.POLYGON, ShapeType.POLYGON)
+                          is Collision.polygon_to_polygon)
+
+        for tmpShapeA, tmpShapeB in pairs:
+            # skip the pair that game logic does not want to collide.
+            if (not (tmpShapeA.category_bits & tmpShapeB.mask_bits) or
+                not (tmpShapeB.category_bits & tmpShapeA.mask_bits)):
+                self.stats.filtered_pair_count += 1
+                continue
+
+            # nothing awake in this pair, nothing moved so the last
+            # contacts are still good. They keep the sleeping bodies
+            # in one island, and are solved again when it wake up.
+            tmpBodyA = tmpShapeA.rigidbody
+            tmpBodyB = tmpShapeB.rigidbody
+            if ((tmpBodyA.is_sleeping or tmpBodyA.inverse_mass == 0.0) and
+                (tmpBodyB.is_sleeping or tmpBodyB.inverse_mass == 0.0)):
+                self.stats.sleeping_pair_count += 1
+                tmpManifold = self.pair_cache.keep_manifold(tmpShapeA, tmpShapeB)
+                if tmpManifold is not None and tmpManifold.contact_count > 0:
+                    self.contacts.append(tmpManifold)
+                continue
+
+            # circle and polygon pairs are collided together below.
+            if tmpShapeA.type == tmpShapeB.type:
+                if batch_circles and tmpShapeA.type == ShapeType.CIRCLE:
+                    circle_pairs.append((tmpShapeA, tmpShapeB))
+                    continue
+                if batch_polygons and tmpShapeA.type == ShapeType.POLYGON:
+                    polygon_pairs.append((tmpShapeA, tmpShapeB))
+                    continue
+
+            tmpManifold = self.pair_cache.get_manifold(tmpShapeA, tmpShapeB)
+            tmpManifold.solve()
+            if tmpManifold.contact_count > 0:
+                self.contacts.append(tmpManifold)
+
+        self.solve_circle_pairs(circle_pairs)
+        self.solve_polygon_pairs(polygon_pairs)
+
+        # pairs no longer in broadphase contact have separated.
+        self.pair_cache.end_step()
+
+        self.stats.contact_pair_count = len(self.contacts)
+        self.stats.new_manifold_count = self.pair_cache.created_count
+        self.stats.axis_cache_hit_count = Collision.axis_cache_hit_count
+        self.stats.axis_cache_miss_count = Collision.axis_cache_miss_count
+        self.stats.bounding_reject_count = Collision.bounding_reject_count
+        self.stats.scratch_vector_count = Collision.scratch_pool.get_capacity()
+
+        # Group the bodies touching each other into islands, islands
+        # do not affect each other so each one is solved on its own.
+        self.islands = Island.build(self.shapes, self.contacts)
+        self.stats.island_count = len(self.islands)
+
+        awake_islands = []
+        awake_shapes = []
+        awake_contacts = []
+        for island in self.islands:
+            # island touched by nothing awake stay asleep.
+            if island.is_sleeping():
+                self.stats.sleeping_body_count += len(island.shapes)
+                continue
+            island.wake()
+
+            self.stats.max_island_size = max(self.stats.max_island_size,
+                                             len(island.shapes))
+            awake_islands.append(island)
+            awake_shapes.extend(island.shapes)
+            awake_contacts.extend(island.contacts)
+
+        # Islands do not share bodies, so all of them are integrated
+        # together around their own contact solve.
+        self.integrate_forces(awake_shapes, deltaTime)
+
+        if self.contact_solver is None:
+            for island in awake_islands:
+                self.stats.iterations_used = max(
+                    self.stats.iterations_used,
+                    self.solve_contacts(island.contacts, deltaTime))
+        else:
+            # array solver gain from big batches, solve every awake
+            # island at once.
+            self.stats.iterations_used = self.solve_contacts(awake_contacts, deltaTime)
+
+        self.integrate_velocity(awake_shapes, deltaTime)
+
+        # Corret positions
+        for index in range(0, len(awake_contacts)):
+            awake_contacts[index].positional_correction()
+
+        for island in awake_islands:
+            if self.allow_sleep and island.update_sleep(
+                    deltaTime,
+                    self.sleep_linear_tolerance,
+                    self.sleep_angular_tolerance,
+                    self.time_to_sleep):
+                self.stats.sleeping_body_count += len(island.shapes)
+
+        # Clear all forces
+        if self.body_store is not None:
+            self.body_store.clear_forces()
+        else:
+            for index in range(0, len(self.shapes)):
+                tmpBody = self.shapes[index].rigidbody
+                tmpBody.force.set_xy(0, 0)
+                tmpBody.torque = 0
+
+    #====================
+    # Protected Methods
+
+    #====================
+    # Private Methods
+    def integrate_forces(self, shapes, deltaTime):
+        """
+        Apply the forces and gravity on the velocity of the shapes.
+        @param { Shape[] } shapes : awake dynamic shapes.
+        @param { float } deltaTime : time step.
+        """
+
+        if self.body_store is None:
+            for index in range(0, len(shapes)):
+                Physics.integrate_forces(shapes[index], deltaTime)
+            return
+
+        self.body_store.integrate_forces(self.store_indices(shapes), deltaTime)
+
+    def integrate_velocity(self, shapes, deltaTime):
+        """
+        Move the shapes by their velocity.
+        @param { Shape[] } shapes : awake dynamic shapes.
+        @param { float } deltaTime : time step.
+        """
+
+        if self.body_store is None:
+            for index in range(0, len(shapes)):
+                Physics.integrate_velocity(shapes[index], deltaTime)
+            return
+
+        self.body_store.integrate_velocity(self.store_indices(shapes), deltaTime)
+
+        # shapes cache their rotation, and mark the transform dirty.
+        for index in range(0, len(shapes)):
+            tmpBody = shapes[index].rigidbody
+            tmpBody.update_orientation(tmpBody.orientation)
+
+    def store_indices(self, shapes):
+        """
+        @param { Shape[] } shapes : shapes in the body store.
+        @return { numpy.ndarray } : store row of each shape's body.
+        """
+        return numpy.array([shape.rigidbody.index for shape in shapes], dtype = int)
+
+    def solve_contacts(self, contacts, deltaTime):
+        """
+        Solve the contacts, the velocity of their bodies is changed.
+        @param { Manifold[] } contacts : contacts to solve.
+        @param { float } deltaTime : time step.
+        @return { int } : iterations the impulse solver ran.
+        """
+
+        # Initialize collision
+        resting_speed_sqr = Manifold.resting_speed_sqr(deltaTime)
+        for index in range(0, len(contacts)):
+            contacts[index].initialize(deltaTime, resting_speed_sqr)
+
+        # Solve Collisions, until a pass barely change anything.
+        iterations_used = 0
+        if self.contact_solver is not None:
+            if self.color_contacts:
+                batches = ContactColoring.color(contacts)
+            else:
+                batches = [contacts]
+
+            self.stats.color_count = len(batches)
+            self.stats.color_batch_sizes = [len(batch) for batch in batches]
+
+            iterations_used = self.contact_solver.solve(
+                batches, self.iterations, self.velocity_tolerance)
+        elif contacts:
+            for index in range(0, self.iterations):
+                max_change = 0.0
+                for index2 in range(0, len(contacts)):
+                    max_change = max(max_change, contacts[index2].apply_impulse())
+
+                iterations_used += 1
+                if max_change < self.velocity_tolerance:
+                    break
+
+        return iterations_used
+
+    def solve_circle_pairs(self, pairs):
+        """
+        Collide the circle pairs in one NumPy batch and keep the
+        manifolds of those in contact.
+        @param { (Circle, Circle)[] } pairs : circle pairs.
+        """
+
+        if len(pairs) >= BatchCollision.MIN_BATCH_SIZE:
+            pairs = self.reject_far_pairs(pairs)
+
+        if len(pairs) < BatchCollision.MIN_BATCH_SIZE:
+            self.solve_pairs(pairs)
+            return
+
+        circles, indexA, indexB = self.index_pair_shapes(pairs)
+
+        positions = numpy.array(
+            [(circle.rigidbody.position.x, circle.rigidbody.position.y)
+             for circle in circles], dtype = float)
+        radii = numpy.array([circle.radius for circle in circles], dtype = float)
+
+        hits, normals, penetrations, points = BatchCollision.circle_to_circle(
+            positions, radii, indexA, indexB)
+
+        # Only the pairs in contact need a manifold
+        for hit, normal, penetration, point in zip(
+                hits.tolist(), normals.tolist(),
+                penetrations.tolist(), points.tolist()):
+            tmpShapeA, tmpShapeB = pairs[hit]
+
+            tmpManifold = self.pair_cache.get_manifold(tmpShapeA, tmpShapeB)
+            tmpManifold.contact_count = 1
+            tmpManifold.feature_ids[0] = 0
+            tmpManifold.penetration = penetration
+            tmpManifold.normal.set_xy(normal[0], normal[1])
+            tmpManifold.contacts[0].set_xy(point[0], point[1])
+            tmpManifold.match_contacts()
+
+            self.contacts.append(tmpManifold)
+
+    def solve_polygon_pairs(self, pairs):
+        """
+        Collide the polygon pairs in one NumPy batch and keep the
+        manifolds of those in contact. Pairs are rejected by their
+        bounding circles first, like 'Manifold.solve' does, but the
+        batch does not use the separating axis cached in the
+        manifolds, so these pairs never count as axis cache hits or
+        misses.
+        @param { (Polygon, Polygon)[] } pairs : polygon pairs.
+        """
+
+        if len(pairs) >= BatchCollision.MIN_BATCH_SIZE:
+            pairs = self.reject_far_pairs(pairs)
+
+        if len(pairs) < BatchCollision.MIN_BATCH_SIZE:
+            self.solve_pairs(pairs)
+            return
+
+        polygons, indexA, indexB = self.index_pair_shapes(pairs)
+
+        vertices, normals, counts = BatchCollision.pack_polygons(polygons)
+
+        (hits, normals, penetrations, points,
+         contact_counts, feature_ids) = BatchCollision.polygon_to_polygon(
+             vertices, normals, counts, indexA, indexB)
+
+        # Only the pairs in contact need a manifold
+        for hit, normal, penetration, point, contact_count, feature_id in zip(
+                hits.tolist(), normals.tolist(), penetrations.tolist(),
+                points.tolist(), contact_counts.tolist(), feature_ids.tolist()):
+            tmpShapeA, tmpShapeB = pairs[hit]
+
+            tmpManifold = self.pair_cache.get_manifold(tmpShapeA, tmpShapeB)
+            tmpManifold.contact_count = contact_count
+            tmpManifold.penetration = penetration
+            tmpManifold.normal.set_xy(normal[0], normal[1])
+            for index in range(0, contact_count):
+                tmpManifold.feature_ids[index] = feature_id[index]
+                tmpManifold.contacts[index].set_xy(point[index][0], point[index][1])
+            tmpManifold.match_contacts()
+
+            self.contacts.append(tmpManifold)
+
+    def solve_pairs(self, pairs):
+        """
+        Collide the pairs one by one with their collider.
+        @param { (Shape, Shape)[] } pairs : pairs to collide.
+        """
+        for tmpShapeA, tmpShapeB in pairs:
+            tmpManifold = self.pair_cache.get_manifold(tmpShapeA, tmpShapeB)
+            tmpManifold.solve()
+            if tmpManifold.contact_count > 0:
+                self.contacts.append(tmpManifold)
+
+    def reject_far_pairs(self, pairs):
+        """
+        Drop the pairs whose bounding circles do not overlap, before
+        packing them for a batch.
+        @param { (Shape, Shape)[] } pairs : pairs to test.
+        @return { (Shape, Shape)[] } : pairs that can touch.
+        """
+
+        shapes, indexA, indexB = self.index_pair_shapes(pairs)
+
+        positions = numpy.array(
+            [(shape.rigidbody.position.x, shape.rigidbody.position.y)
+             for shape in shapes], dtype = float)
+        radii = numpy.array([shape.bounding_radius for shape in shapes], dtype = float)
+
+        overlap = BatchCollision.bounding_circles_overlap(
+            positions, radii, indexA, indexB)
+        return [pairs[index] for index in overlap.tolist()]
+
+    def index_pair_shapes(self, pairs):
+        """
+        Give each shape of the pairs an index into batch arrays.
+        @param { (Shape, Shape)[] } pairs : pairs to index.
+        @return { tuple } : (shapes, indexA, indexB), shape of each
+        index and the index arrays of the pairs.
+        """
+        shape_indices = {}
+        indexA = []
+        indexB = []
+        for tmpShapeA, tmpShapeB in pairs:
+            indexA.append(shape_indices.setdefault(tmpShapeA, len(shape_indices)))
+            indexB.append(shape_indices.setdefault(tmpShapeB, len(shape_indices)))
+
+        shapes = [None] * len(shape_indices)
+        for shape, index in shape_indices.items():
+            shapes[index] = shape
+
+        return shapes, numpy.array(indexA), numpy.array(indexB)
+
+    #====================
+    # setter / getter
+    def get_interpolation_alpha(self):
+        """
+        @return { float } : part of a fixed step left in the
+        accumulator, to blend the last two states when rendering.
+        """
+        return self.accumulator / self.time_step
+
+    def set_broadphase(self, broadphase):
+        """
+        Swap the broadphase, current shapes are moved to the
+        new one. e.g. 'SpatialHash', 'SweepAndPrune' or 'DynamicTree'.
+        @param { Broadphase } broadphase : new broadphase.
+        """
+        for shape in self.broadphase.shapes:
+            broadphase.add_shape(shape)
+
+        self.broadphase = broadphase
+
+    def get_broadphase(self):
+        return self.broadphase
+
+    def set_contact_solver(self, contact_solver):
+        """
+        Solve the contacts with a 'ContactSolver', or None to solve
+        them one manifold at a time.
+        @param { ContactSolver } contact_solver : solver to use.
+        @return { bool } : False if NumPy is missing, the contacts
+        are still solved one manifold at a time.
+        """
+        if contact_solver is not None and not ContactSolver.HAS_NUMPY:
+            return False
+
+        self.contact_solver = contact_solver
+        return True
+
+    def get_contact_solver(self):
+        return self.contact_solver
+
+    def set_body_store(self, body_store):
+        """
+        Keep the bodies in a 'BodyStore' and integrate them with
+        NumPy. Set it before adding any shape.
+        @param { BodyStore } body_store : store to use.
+        @return { bool } : False if NumPy is missing or shapes were
+        already added, bodies are still integrated one by one.
+        """
+        if self.shapes or not BodyStore.HAS_NUMPY:
+            return False
+
+        self.body_store = body_store
+        return True
+
+    def get_body_store(self):
+        return self.body_store
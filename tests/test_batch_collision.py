@@ -0,0 +1,103 @@
+# ========================================================================
+# $File: test_batch_collision.py $
+# $Date: 2026-10-19 15:31:06 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+import math
+import random
+import unittest
+
+# World first, it import the physics modules in working order.
+from jcspygm_physics.world import World
+from jcspygm_physics.batch_collision import BatchCollision
+from jcspygm_physics.shapes.polygon import Polygon
+from jcspygm_physics.vector2 import Vector2
+
+
+POLYGON_COUNT = 60
+SIDE_COUNTS = [0, 0, 5, 8, 32]
+TOLERANCE = 1.0e-6
+
+
+def make_polygon(rand):
+    """
+    Random box or regular polygon, '0' side count is a box.
+    @param { Random } rand : seeded generator.
+    @return { Polygon } : polygon placed and rotated.
+    """
+    polygon = Polygon(rand.uniform(0, 120), rand.uniform(0, 120))
+    sideCount = rand.choice(SIDE_COUNTS)
+    if sideCount == 0:
+        polygon.set_box(rand.uniform(4, 15), rand.uniform(4, 15))
+    else:
+        radius = rand.uniform(5, 20)
+        vertices = [Vector2(radius * math.cos(2 * math.pi * index / sideCount),
+                            radius * math.sin(2 * math.pi * index / sideCount))
+                    for index in range(0, sideCount)]
+        polygon.set_rand_convex_poly(vertices, sideCount)
+    polygon.get_rigidbody().set_orientation(rand.uniform(-math.pi, math.pi))
+    return polygon
+
+
+def collide(pairs, batch):
+    """
+    Collide the pairs in a fresh world.
+    @param { (Polygon, Polygon)[] } pairs : pairs to collide.
+    @param { bool } batch : True for the NumPy batch, False for
+    one by one.
+    @return { dict } : manifold of each pair in contact.
+    """
+    world = World()
+    if batch:
+        world.solve_polygon_pairs(pairs)
+    else:
+        world.solve_pairs(pairs)
+    return dict(((manifold.shapeA, manifold.shapeB), manifold)
+                for manifold in world.contacts)
+
+
+@unittest.skipUnless(BatchCollision.HAS_NUMPY, "needs NumPy")
+class TestBatchCollision(unittest.TestCase):
+    """NumPy batch must give the same manifolds as the scalar path."""
+
+    def test_solve_polygon_pairs_matches_scalar(self):
+        rand = random.Random(3)
+        polygons = [make_polygon(rand) for count in range(0, POLYGON_COUNT)]
+        pairs = [(polygons[indexA], polygons[indexB])
+                 for indexA in range(0, len(polygons))
+                 for indexB in range(indexA + 1, len(polygons))]
+
+        batch = collide(pairs, True)
+        scalar = collide(pairs, False)
+
+        self.assertGreaterEqual(len(scalar), BatchCollision.MIN_BATCH_SIZE)
+        self.assertEqual(set(batch), set(scalar))
+
+        for key in scalar:
+            expected = scalar[key]
+            actual = batch[key]
+
+            self.assertEqual(actual.contact_count, expected.contact_count)
+            self.assertAlmostEqual(actual.penetration, expected.penetration,
+                                   delta = TOLERANCE)
+            self.assertAlmostEqual(actual.normal.x, expected.normal.x,
+                                   delta = TOLERANCE)
+            self.assertAlmostEqual(actual.normal.y, expected.normal.y,
+                                   delta = TOLERANCE)
+            for index in range(0, expected.contact_count):
+                self.assertEqual(actual.feature_ids[index],
+                                 expected.feature_ids[index])
+                self.assertAlmostEqual(actual.contacts[index].x,
+                                       expected.contacts[index].x,
+                                       delta = TOLERANCE)
+                self.assertAlmostEqual(actual.contacts[index].y,
+                                       expected.contacts[index].y,
+                                       delta = TOLERANCE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# ========================================================================
+# $File: test_body_store.py $
+# $Date: 2026-10-19 14:32:20 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+import unittest
+
+# World first, it import the physics modules in working order.
+from jcspygm_physics.world import World
+from jcspygm_physics.body_store import BodyStore
+from jcspygm_physics.shapes.polygon import Polygon
+from jcspygm_physics.vector2 import Vector2
+
+
+@unittest.skipUnless(BodyStore.HAS_NUMPY, "needs NumPy")
+class TestBodyStore(unittest.TestCase):
+    """Bodies added to a store keep working through old references."""
+
+    def test_add_shape_keeps_rigidbody(self):
+        world = World()
+        self.assertTrue(world.set_body_store(BodyStore(capacity = 1)))
+
+        box = Polygon(0, 0)
+        box.set_box(5, 5)
+        box.set_orientation(0)
+        body = box.get_rigidbody()
+
+        world.add_shape(box)
+        # second shape make the store grow under the first body.
+        other = Polygon(100, 100)
+        other.set_box(5, 5)
+        world.add_shape(other)
+
+        self.assertIs(box.get_rigidbody(), body)
+
+        body.apply_force(Vector2(1000, 0))
+        body.angular_velocity = 1.0
+        world.step(World.DEFAULT_TIME_STEP)
+
+        store = world.get_body_store()
+        self.assertEqual(store.positions[body.index, 0], body.position.x)
+        self.assertGreater(body.position.x, 0)
+        self.assertNotEqual(body.orientation, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# ========================================================================
+# $File: test_collision.py $
+# $Date: 2026-10-19 14:05:12 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+import math
+import random
+import unittest
+
+# World first, it import the physics modules in working order.
+import jcspygm_physics.world
+from jcspygm_physics.collision import Collision
+from jcspygm_physics.manifold import Manifold
+from jcspygm_physics.shapes.polygon import Polygon
+from jcspygm_physics.vector2 import Vector2
+
+
+POLYGON_COUNT = 80
+SIDE_COUNTS = [0, 5, 8, 16, 64]
+DEPTH_TOLERANCE = 1.0e-6
+
+
+def make_polygon(rand):
+    """
+    Random box or regular polygon, '0' side count is a box.
+    @param { Random } rand : seeded generator.
+    @return { Polygon } : polygon placed and rotated.
+    """
+    polygon = Polygon(rand.uniform(0, 100), rand.uniform(0, 100))
+    sideCount = rand.choice(SIDE_COUNTS)
+    if sideCount == 0:
+        polygon.set_box(rand.uniform(4, 15), rand.uniform(4, 15))
+    else:
+        radius = rand.uniform(5, 20)
+        vertices = [Vector2(radius * math.cos(2 * math.pi * index / sideCount),
+                            radius * math.sin(2 * math.pi * index / sideCount))
+                    for index in range(0, sideCount)]
+        polygon.set_rand_convex_poly(vertices, sideCount)
+    polygon.set_orientation(rand.uniform(-math.pi, math.pi))
+    return polygon
+
+
+def depth_along(polyA, polyB, normal):
+    """
+    @return { float } : overlap of the two polygons projected on 'normal'.
+    """
+    verticesA = polyA.get_world_vertices()[:polyA.vertex_count]
+    verticesB = polyB.get_world_vertices()[:polyB.vertex_count]
+    return (max(vert.x * normal.x + vert.y * normal.y for vert in verticesA) -
+            min(vert.x * normal.x + vert.y * normal.y for vert in verticesB))
+
+
+class TestPolygonToPolygonGJK(unittest.TestCase):
+    """GJK / EPA narrow phase must agree with the SAT one."""
+
+    def test_matches_sat_on_random_pairs(self):
+        rand = random.Random(7)
+        polygons = [make_polygon(rand) for count in range(0, POLYGON_COUNT)]
+
+        hitCount = 0
+        for indexA in range(0, len(polygons)):
+            for indexB in range(indexA + 1, len(polygons)):
+                polyA = polygons[indexA]
+                polyB = polygons[indexB]
+
+                # Overlap by the separating axis test itself, SAT
+                # clipping can lose both points on a short face.
+                separationA = Collision.find_axis_least_penetration(
+                    polyA, polyB)[0]
+                separationB = Collision.find_axis_least_penetration(
+                    polyB, polyA)[0]
+                overlap = separationA < 0.0 and separationB < 0.0
+
+                gjk = Manifold(polyA, polyB)
+                Collision.polygon_to_polygon_gjk(gjk, polyA, polyB)
+                self.assertEqual(overlap, gjk.contact_count > 0)
+                if not overlap:
+                    continue
+                hitCount += 1
+
+                # GJK must push out along the smallest depth, never
+                # deeper than the SAT manifold does.
+                gjkDepth = depth_along(polyA, polyB, gjk.normal)
+                self.assertLessEqual(
+                    gjkDepth,
+                    -max(separationA, separationB) + DEPTH_TOLERANCE)
+
+                sat = Manifold(polyA, polyB)
+                Collision.polygon_to_polygon(sat, polyA, polyB)
+                if sat.contact_count > 0:
+                    self.assertLessEqual(
+                        gjkDepth,
+                        depth_along(polyA, polyB, sat.normal) +
+                        DEPTH_TOLERANCE)
+
+        self.assertGreater(hitCount, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
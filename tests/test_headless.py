@@ -0,0 +1,58 @@
+# ========================================================================
+# $File: test_headless.py $
+# $Date: 2026-10-19 10:12:40 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+# Run in a fresh interpreter where 'jcspygm' and 'pygame' can not be
+# imported, the world has to build and step without them.
+HEADLESS_SCRIPT = """
+import sys
+sys.modules['jcspygm'] = None
+sys.modules['pygame'] = None
+
+from jcspygm_physics.world import World
+from jcspygm_physics.shapes.circle import Circle
+from jcspygm_physics.shapes.polygon import Polygon
+
+world = World()
+ground = Polygon(0, 20)
+ground.set_box(50, 5)
+ground.set_orientation(0)
+ground.get_rigidbody().set_static()
+world.add_shape(ground)
+world.add_shape(Circle(0, 10, 5))
+
+for count in range(0, 10):
+    world.step(World.DEFAULT_TIME_STEP)
+
+assert len(world.contacts) == 1
+"""
+
+
+class TestHeadless(unittest.TestCase):
+    """Physics core must not depend on the render layer."""
+
+    def test_world_without_jcspygm(self):
+        process = subprocess.Popen(
+            [sys.executable, "-c", HEADLESS_SCRIPT],
+            cwd = ROOT,
+            stdout = subprocess.PIPE,
+            stderr = subprocess.STDOUT)
+        output = process.communicate()[0]
+        self.assertEqual(process.returncode, 0, output)
+
+
+if __name__ == "__main__":
+    unittest.main()
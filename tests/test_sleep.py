@@ -0,0 +1,62 @@
+# ========================================================================
+# $File: test_sleep.py $
+# $Date: 2026-10-19 15:02:47 $
+# $Revision: $
+# $Creator: Jen-Chieh Shen $
+# $Notice: See LICENSE.txt for modification and distribution information
+#                   Copyright (c) 2017 by Shen, Jen-Chieh $
+# ========================================================================
+
+import unittest
+
+# World first, it import the physics modules in working order.
+from jcspygm_physics.world import World
+from jcspygm_physics.physics import Physics
+from jcspygm_physics.shapes.polygon import Polygon
+
+
+def make_resting_box():
+    """
+    @return { (World, Polygon) } : world with a box resting on the
+    ground, stepped until the box fall asleep.
+    """
+    world = World()
+
+    ground = Polygon(0, 20)
+    ground.set_box(50, 5)
+    ground.set_orientation(0)
+    ground.get_rigidbody().set_static()
+    world.add_shape(ground)
+
+    box = Polygon(0, 10)
+    box.set_box(5, 5)
+    box.get_rigidbody().set_orientation(0)
+    world.add_shape(box)
+
+    stepCount = int(4 * Physics.TIME_TO_SLEEP / World.DEFAULT_TIME_STEP)
+    for count in range(0, stepCount):
+        world.step(World.DEFAULT_TIME_STEP)
+
+    return world, box
+
+
+class TestSleep(unittest.TestCase):
+    """Moving a body by hand wake it, the integrator does not."""
+
+    def test_resting_body_sleeps(self):
+        world, box = make_resting_box()
+        self.assertTrue(box.get_rigidbody().is_sleeping)
+
+    def test_rigidbody_set_orientation_wakes(self):
+        world, box = make_resting_box()
+        box.get_rigidbody().set_orientation(0.5)
+        self.assertFalse(box.get_rigidbody().is_sleeping)
+
+    def test_shape_set_orientation_wakes(self):
+        world, box = make_resting_box()
+        box.set_orientation(0.5)
+        self.assertFalse(box.get_rigidbody().is_sleeping)
+
+
+if __name__ == "__main__":
+    unittest.main()